@@ -7,12 +7,30 @@ This will replace your old client with the correct one.
 PASTE THIS INTO UE5 PYTHON CONSOLE:
 """
 
+import json
+import os
 import requests
+import tempfile
 import zipfile
-import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import unreal
 
+
+def _write_json_atomic(path, obj):
+    """Write obj as JSON via temp file + os.replace; skip if unchanged."""
+    new = json.dumps(obj, indent=2).encode("utf-8")
+    try:
+        if path.read_bytes() == new:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(new)
+    os.replace(tmp, path)
+    return True
+
+
 print("\n" + "=" * 70)
 print("📥 DOWNLOADING LATEST CLIENT FROM WORKING SERVER")
 print("=" * 70)
@@ -25,11 +43,15 @@ print(f"📡 Server: {server_url}")
 print(f"⬇️  Downloading from: {download_url}")
 
 try:
-    # Download the client ZIP
-    response = requests.get(download_url, timeout=30)
-    response.raise_for_status()
+    # Download the client ZIP (streamed; spills to disk past 8 MB)
+    archive = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    with requests.get(download_url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=65536):
+            archive.write(chunk)
     
-    print(f"✅ Downloaded {len(response.content)} bytes")
+    print(f"✅ Downloaded {archive.tell()} bytes")
+    archive.seek(0)
     
     # Extract to Content/Python
     project_dir = Path(unreal.Paths.project_dir())
@@ -38,8 +60,17 @@ try:
     print(f"📂 Extracting to: {target_dir}")
     
     # Extract ZIP
-    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-        zf.extractall(target_dir)
+    with archive, zipfile.ZipFile(archive) as zf:
+        names = zf.namelist()
+        # Create folders up front so worker threads don't race on makedirs
+        target_root = target_dir.resolve()
+        for folder in {os.path.dirname(name) for name in names}:
+            folder_path = (target_dir / folder).resolve()
+            if folder_path.is_relative_to(target_root):
+                folder_path.mkdir(parents=True, exist_ok=True)
+        # zlib releases the GIL, so members inflate in parallel
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda name: zf.extract(name, target_dir), names))
     
     print("✅ Client files extracted successfully!")
     
@@ -47,13 +78,11 @@ try:
     config_file = target_dir / "AIAssistant" / "core" / "ai_config.json"
     config_file.parent.mkdir(parents=True, exist_ok=True)
     
-    import json
     config = {
         "api_base_url": server_url,
         "active_server": "production"
     }
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    _write_json_atomic(config_file, config)
     
     print(f"✅ Config created: {server_url}")
     print("=" * 70)
@@ -10,8 +10,23 @@ COPY AND PASTE THIS ENTIRE CODE INTO UE5 PYTHON CONSOLE:
 # === START: Copy everything below this line ===
 
 import json
+import os
 from pathlib import Path
 
+def _write_json_atomic(path, obj):
+    """Write obj as JSON via temp file + os.replace; skip if unchanged."""
+    new = json.dumps(obj, indent=2).encode("utf-8")
+    try:
+        if path.read_bytes() == new:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(new)
+    os.replace(tmp, path)
+    return True
+
+
 # Get the config file location
 config_dir = Path(__file__).parent / "AIAssistant" / "core"
 config_file = config_dir / "ai_config.json"
@@ -42,10 +57,10 @@ config['SERVER_PRESETS']['localhost'] = 'http://localhost:5000'
 
 # Save updated config
 config_dir.mkdir(parents=True, exist_ok=True)
-with open(config_file, 'w') as f:
-    json.dump(config, f, indent=2)
-
-print(f"✅ Updated URL to: {config['api_base_url']}")
+if _write_json_atomic(config_file, config):
+    print(f"✅ Updated URL to: {config['api_base_url']}")
+else:
+    print(f"✅ Already set to: {config['api_base_url']}")
 print("=" * 70)
 print("\n🔄 Now restart the assistant:")
 print("   from AIAssistant.system.auto_update import force_restart_assistant")
@@ -1,12 +1,31 @@
 """Configuration management for the UE5 AI Assistant backend."""
 import json
-from pathlib import Path
-from typing import Any, Dict
+import logging
+import os
+import sys
+import tempfile
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
 
-CONFIG_FILE = Path("app/data/config.json")
+from pydantic import ValidationError
 
-# Response style presets with intelligent filtering and output control
-RESPONSE_STYLES = {
+from app.models import ConfigUpdate
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore  # Optional dependency
+    HAS_ORJSON = False
+
+log = logging.getLogger(__name__)
+
+# Plain str: os.stat/open take it without os.fspath() conversion
+CONFIG_FILE = "app/data/config.json"
+
+# Response style presets with intelligent filtering and output control.
+# Read-only (frozen below) so they can be shared without defensive copies.
+RESPONSE_STYLES: Mapping[str, Mapping[str, Any]] = {
     "descriptive": {
         "name": "Descriptive (Default)",
         "prompt_modifier": (
@@ -87,7 +106,43 @@ RESPONSE_STYLES = {
     }
 }
 
-DEFAULT_CONFIG = {
+# Short labels compared downstream (filter modes, focus) are interned so
+# equal values share one object and compare by identity.
+for _style in RESPONSE_STYLES.values():
+    for _key in ("name", "data_filter", "focus"):
+        _style[_key] = sys.intern(_style[_key])
+del _style, _key
+
+RESPONSE_STYLES = MappingProxyType({
+    sys.intern(name): MappingProxyType(style)
+    for name, style in RESPONSE_STYLES.items()
+})
+
+
+class ResponseStyle(NamedTuple):
+    """A response style preset with attribute access."""
+    name: str
+    prompt_modifier: str
+    max_tokens: int
+    data_filter: str
+    focus: str
+    temperature_override: Optional[float] = None
+
+
+# Tuple form of RESPONSE_STYLES for request handling. The dict form stays
+# for the /api/config payload.
+STYLES: Mapping[str, ResponseStyle] = MappingProxyType({
+    name: ResponseStyle(**style) for name, style in RESPONSE_STYLES.items()
+})
+DEFAULT_STYLE = STYLES["descriptive"]
+
+
+def get_style(style_name: str) -> ResponseStyle:
+    """Get a response style, falling back to "descriptive" if unknown."""
+    return STYLES.get(style_name, DEFAULT_STYLE)
+
+
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
     "model": "gpt-4o-mini",
     "temperature": 0.7,
     "max_context_turns": 6,
@@ -95,26 +150,103 @@ DEFAULT_CONFIG = {
     "max_retries": 3,
     "retry_delay": 2.5,
     "verbose": False,
-    "response_style": "descriptive"
-}
+    "response_style": "descriptive",
+    "cache_responses": False
+})
+
+
+# (st_mtime_ns, st_size, merged config) from the last successful load
+_CACHE: Optional[Tuple[int, int, Dict[str, Any]]] = None
+
+
+def invalidate_config_cache() -> None:
+    """Force the next load_config() call to re-read the file."""
+    global _CACHE
+    _CACHE = None
+
+
+def _parse_config(data: bytes) -> Dict[str, Any]:
+    """
+    Parse and validate config file contents in a single pass.
+
+    Unknown keys are dropped. Keys whose values have the wrong type are
+    reported and left to their defaults instead of discarding the file.
+    """
+    try:
+        settings = ConfigUpdate.model_validate_json(data)
+    except ValidationError as e:
+        bad_keys = {err["loc"][0] for err in e.errors() if err["loc"]}
+        if not bad_keys:
+            raise  # Not JSON, or not an object
+        log.warning("Invalid config values for %s, using defaults for them",
+                    ", ".join(map(str, sorted(bad_keys))))
+        raw = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        settings = ConfigUpdate.model_validate(
+            {k: v for k, v in raw.items() if k not in bad_keys})
+    return settings.model_dump(exclude_none=True)
 
 
 def load_config() -> Dict[str, Any]:
-    """Load configuration from file or use defaults."""
-    if CONFIG_FILE.exists():
+    """
+    Load configuration from file or use defaults.
+
+    The parsed file is cached until its mtime or size changes. Callers get
+    their own shallow copy and may mutate it freely.
+    """
+    global _CACHE
+    try:
+        st = os.stat(CONFIG_FILE)
+        if _CACHE and _CACHE[:2] == (st.st_mtime_ns, st.st_size):
+            return dict(_CACHE[2])
+        # One read of the whole file instead of buffered file-object reads
+        fd = os.open(CONFIG_FILE, os.O_RDONLY | getattr(os, "O_BINARY", 0))
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                return {**DEFAULT_CONFIG, **config}
-        except Exception as e:
-            print(f"Error loading config: {e}, using defaults")
+            st = os.fstat(fd)
+            data = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+        # mappingproxy | dict copies the defaults and merges in C
+        merged = DEFAULT_CONFIG | _parse_config(data)
+        _CACHE = (st.st_mtime_ns, st.st_size, merged)
+        return dict(merged)
+    except FileNotFoundError:
+        pass
+    # ValueError covers pydantic's ValidationError (malformed JSON or a
+    # non-object top level)
+    except (ValueError, OSError) as e:
+        log.warning("Error loading config: %s, using defaults", e)
     return DEFAULT_CONFIG.copy()
 
 
 def save_config(config: Dict[str, Any]) -> None:
-    """Save configuration to file."""
+    """
+    Save configuration to file.
+
+    The JSON is encoded in one go and written to a temp file that replaces
+    the config atomically, so a crash mid-write cannot truncate it. Output
+    is compact unless the config has "verbose" enabled.
+    """
+    tmp_path = None
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        pretty = bool(config.get("verbose"))
+        if HAS_ORJSON:
+            data = orjson.dumps(config,
+                                option=orjson.OPT_INDENT_2 if pretty else 0)
+        elif pretty:
+            data = json.dumps(config, indent=2).encode()
+        else:
+            data = json.dumps(config, separators=(",", ":")).encode()
+        with tempfile.NamedTemporaryFile('wb',
+                                         dir=os.path.dirname(CONFIG_FILE),
+                                         prefix=os.path.basename(CONFIG_FILE),
+                                         suffix='.tmp',
+                                         delete=False) as f:
+            tmp_path = f.name
+            f.write(data)
+        os.replace(tmp_path, CONFIG_FILE)
     except Exception as e:
-        print(f"Error saving config: {e}")
+        log.error("Error saving config: %s", e)
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    finally:
+        invalidate_config_cache()
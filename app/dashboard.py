@@ -1,1093 +1,310 @@
-"""Dashboard HTML template for the UE5 AI Assistant."""
-
-def get_dashboard_html() -> str:
-    """Return the dashboard HTML content."""
-    return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>UE5 AI Assistant - Dashboard</title>
-<style>
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    body {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        background: #0a0e27;
-        background-image: 
-            linear-gradient(rgba(0, 245, 255, 0.03) 1px, transparent 1px),
-            linear-gradient(90deg, rgba(0, 245, 255, 0.03) 1px, transparent 1px);
-        background-size: 50px 50px;
-        min-height: 100vh;
-        padding: 20px;
-        color: #e0e6ed;
-    }
-    
-    .container {
-        max-width: 1400px;
-        margin: 0 auto;
-    }
-    
-    .header {
-        background: rgba(15, 23, 42, 0.95);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(0, 245, 255, 0.2);
-        padding: 30px;
-        border-radius: 12px;
-        box-shadow: 0 0 30px rgba(0, 245, 255, 0.1), 0 10px 30px rgba(0,0,0,0.5);
-        margin-bottom: 20px;
-    }
-    
-    .header h1 {
-        color: #00f5ff;
-        margin-bottom: 10px;
-        font-weight: 700;
-        text-shadow: 0 0 20px rgba(0, 245, 255, 0.5);
-        letter-spacing: -0.5px;
-    }
-    
-    .header p {
-        color: #94a3b8;
-        font-size: 0.95em;
-    }
-    
-    .stats {
-        display: flex;
-        gap: 15px;
-        margin-top: 20px;
-    }
-    
-    .stat-card {
-        flex: 1;
-        background: rgba(0, 245, 255, 0.05);
-        border: 1px solid rgba(0, 245, 255, 0.2);
-        color: #e0e6ed;
-        padding: 15px;
-        border-radius: 8px;
-        text-align: center;
-        transition: all 0.3s;
-    }
-    
-    .stat-card:hover {
-        background: rgba(0, 245, 255, 0.1);
-        box-shadow: 0 0 20px rgba(0, 245, 255, 0.2);
-    }
-    
-    .stat-card .number {
-        font-size: 2em;
-        font-weight: bold;
-        color: #00f5ff;
-        text-shadow: 0 0 10px rgba(0, 245, 255, 0.5);
-    }
-    
-    .stat-card .label {
-        opacity: 0.7;
-        font-size: 0.9em;
-        color: #94a3b8;
-    }
-    
-    .tabs {
-        display: flex;
-        gap: 10px;
-        margin-bottom: 20px;
-    }
-    
-    .tab {
-        background: rgba(15, 23, 42, 0.8);
-        border: 1px solid rgba(0, 245, 255, 0.2);
-        color: #94a3b8;
-        padding: 12px 24px;
-        border-radius: 8px;
-        cursor: pointer;
-        font-size: 16px;
-        font-weight: 500;
-        transition: all 0.3s;
-    }
-    
-    .tab.active {
-        background: rgba(0, 245, 255, 0.1);
-        border-color: #00f5ff;
-        color: #00f5ff;
-        box-shadow: 0 0 20px rgba(0, 245, 255, 0.3);
-    }
-    
-    .tab:hover {
-        transform: translateY(-2px);
-        border-color: #00f5ff;
-        color: #00f5ff;
-    }
-    
-    .tab-content {
-        display: none;
-        background: rgba(15, 23, 42, 0.95);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(0, 245, 255, 0.2);
-        padding: 30px;
-        border-radius: 12px;
-        box-shadow: 0 0 30px rgba(0, 245, 255, 0.1);
-    }
-    
-    .tab-content h2 {
-        color: #00f5ff;
-        margin-bottom: 15px;
-    }
-    
-    .tab-content.active {
-        display: block;
-    }
-    
-    .conversation-list {
-        display: flex;
-        flex-direction: column;
-        gap: 15px;
-    }
-    
-    .conversation-item {
-        border: 1px solid rgba(0, 245, 255, 0.15);
-        background: rgba(0, 20, 40, 0.5);
-        border-radius: 8px;
-        padding: 20px;
-        transition: all 0.3s;
-    }
-    
-    .conversation-item:hover {
-        box-shadow: 0 0 20px rgba(0, 245, 255, 0.2);
-        border-color: #00f5ff;
-        background: rgba(0, 20, 40, 0.8);
-    }
-    
-    .conversation-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 12px;
-    }
-    
-    .timestamp {
-        color: #64748b;
-        font-size: 0.85em;
-        font-family: 'Courier New', monospace;
-    }
-    
-    .command-type {
-        background: rgba(0, 245, 255, 0.2);
-        color: #00f5ff;
-        padding: 4px 12px;
-        border-radius: 12px;
-        font-size: 0.85em;
-        border: 1px solid rgba(0, 245, 255, 0.3);
-        font-family: 'Courier New', monospace;
-    }
-    
-    .user-input {
-        background: rgba(0, 0, 0, 0.4);
-        border: 1px solid rgba(0, 245, 255, 0.1);
-        padding: 12px;
-        border-radius: 6px;
-        margin-bottom: 12px;
-        color: #cbd5e1;
-        border-left: 3px solid #667eea;
-    }
-    
-    .user-input strong {
-        color: #00f5ff;
-    }
-    
-    .assistant-response {
-        background: rgba(0, 0, 0, 0.4);
-        border: 1px solid rgba(0, 245, 255, 0.1);
-        padding: 12px;
-        border-radius: 6px;
-        border-left: 3px solid #00f5ff;
-        max-height: 200px;
-        overflow-y: auto;
-        color: #cbd5e1;
-    }
-    
-    .assistant-response strong {
-        color: #00f5ff;
-    }
-    
-    .empty-state {
-        text-align: center;
-        padding: 60px 20px;
-        color: #64748b;
-    }
-    
-    .empty-state svg {
-        width: 80px;
-        height: 80px;
-        margin-bottom: 20px;
-        opacity: 0.3;
-        stroke: #00f5ff;
-    }
-    
-    .refresh-btn {
-        background: rgba(0, 245, 255, 0.1);
-        border: 1px solid #00f5ff;
-        color: #00f5ff;
-        padding: 10px 20px;
-        border-radius: 6px;
-        cursor: pointer;
-        font-size: 14px;
-        font-weight: 500;
-        display: flex;
-        align-items: center;
-        gap: 8px;
-        transition: all 0.3s;
-    }
-    
-    .refresh-btn:hover {
-        background: rgba(0, 245, 255, 0.2);
-        box-shadow: 0 0 15px rgba(0, 245, 255, 0.3);
-    }
-    
-    .auto-refresh {
-        display: flex;
-        align-items: center;
-        gap: 8px;
-        color: #94a3b8;
-        font-size: 14px;
-    }
-    
-    .controls {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 20px;
-    }
-    
-    .setting-group {
-        background: rgba(0, 20, 40, 0.4);
-        border: 1px solid rgba(0, 245, 255, 0.15);
-        padding: 20px;
-        border-radius: 8px;
-        transition: all 0.3s;
-    }
-    
-    .setting-group:hover {
-        border-color: rgba(0, 245, 255, 0.3);
-        background: rgba(0, 20, 40, 0.6);
-    }
-    
-    .setting-label {
-        display: flex;
-        flex-direction: column;
-        gap: 5px;
-        margin-bottom: 12px;
-    }
-    
-    .setting-label strong {
-        color: #00f5ff;
-    }
-    
-    .setting-description {
-        font-size: 13px;
-        color: #94a3b8;
-        font-weight: normal;
-    }
-    
-    .setting-input, .setting-slider {
-        width: 100%;
-        padding: 10px;
-        background: rgba(0, 0, 0, 0.4);
-        border: 1px solid rgba(0, 245, 255, 0.2);
-        border-radius: 6px;
-        font-size: 14px;
-        color: #e0e6ed;
-        transition: all 0.3s;
-    }
-    
-    .setting-input:focus {
-        outline: none;
-        border-color: #00f5ff;
-        box-shadow: 0 0 10px rgba(0, 245, 255, 0.2);
-    }
-    
-    .setting-slider {
-        padding: 0;
-        height: 8px;
-        cursor: pointer;
-        accent-color: #00f5ff;
-    }
-    
-    .save-btn, .reset-btn {
-        padding: 12px 24px;
-        border-radius: 8px;
-        font-size: 16px;
-        font-weight: 600;
-        cursor: pointer;
-        transition: all 0.3s;
-    }
-    
-    .save-btn {
-        background: rgba(0, 245, 255, 0.1);
-        border: 1px solid #00f5ff;
-        color: #00f5ff;
-        flex: 1;
-    }
-    
-    .save-btn:hover {
-        background: rgba(0, 245, 255, 0.2);
-        box-shadow: 0 0 20px rgba(0, 245, 255, 0.3);
-        transform: translateY(-2px);
-    }
-    
-    .reset-btn {
-        background: rgba(100, 116, 139, 0.1);
-        border: 1px solid #64748b;
-        color: #94a3b8;
-        flex: 1;
-    }
-    
-    .reset-btn:hover {
-        background: rgba(100, 116, 139, 0.2);
-        border-color: #94a3b8;
-        color: #cbd5e1;
-    }
-    
-    .clear-history-btn:hover {
-        background: #c0392b !important;
-        box-shadow: 0 0 20px rgba(231, 76, 60, 0.4) !important;
-        transform: translateY(-2px);
-    }
-    
-    .save-status {
-        padding: 12px;
-        border-radius: 6px;
-        text-align: center;
-        font-weight: 500;
-        transition: all 0.3s;
-    }
-    
-    .save-status.success {
-        background: rgba(16, 185, 129, 0.2);
-        color: #10b981;
-        border: 1px solid rgba(16, 185, 129, 0.3);
-    }
-    
-    .save-status.error {
-        background: rgba(239, 68, 68, 0.2);
-        color: #ef4444;
-        border: 1px solid rgba(239, 68, 68, 0.3);
-    }
-    
-    /* Mobile Responsive Design */
-    @media (max-width: 768px) {
-        body {
-            padding: 10px;
-            background-size: 30px 30px;
-        }
-        
-        .container {
-            max-width: 100%;
-            padding: 0;
-        }
-        
-        .header {
-            padding: 20px 15px;
-        }
-        
-        .header h1 {
-            font-size: 1.5em;
-        }
-        
-        .header p {
-            font-size: 0.9em;
-        }
-        
-        .stats {
-            flex-direction: column;
-            gap: 10px;
-        }
-        
-        .stat-card {
-            padding: 12px;
-        }
-        
-        .tabs {
-            flex-wrap: wrap;
-            gap: 8px;
-            padding: 10px;
-        }
-        
-        .tab {
-            padding: 10px 16px;
-            font-size: 14px;
-            flex: 1 1 auto;
-            min-width: fit-content;
-        }
-        
-        .card, .tab-content {
-            padding: 15px;
-            margin: 10px;
-        }
-        
-        .controls {
-            flex-direction: column;
-            align-items: flex-start;
-            gap: 15px;
-        }
-        
-        .controls > div {
-            width: 100%;
-            flex-wrap: wrap;
-            justify-content: flex-start;
-        }
-        
-        .refresh-btn {
-            flex: 1;
-            min-width: 120px;
-        }
-        
-        .auto-refresh {
-            flex: 1;
-            min-width: fit-content;
-        }
-        
-        .settings-grid {
-            grid-template-columns: 1fr;
-        }
-        
-        .conversation-item {
-            padding: 15px;
-        }
-        
-        .conversation-header {
-            flex-direction: column;
-            align-items: flex-start;
-            gap: 8px;
-        }
-        
-        h2 {
-            font-size: 1.3em;
-            margin: 0 0 10px 0;
-        }
-        
-        h3 {
-            font-size: 1.1em;
-        }
-        
-        ul {
-            padding-left: 20px;
-        }
-        
-        .setting-input,
-        .setting-select {
-            font-size: 16px; /* Prevents zoom on iOS */
-        }
-        
-        .setting-group {
-            margin-bottom: 20px;
-        }
-    }
-    
-    @media (max-width: 480px) {
-        body {
-            padding: 5px;
-        }
-        
-        .container {
-            padding: 0;
-        }
-        
-        .header {
-            padding: 15px 10px;
-        }
-        
-        .header h1 {
-            font-size: 1.2em;
-        }
-        
-        .header p {
-            font-size: 0.85em;
-        }
-        
-        .stat-card {
-            padding: 10px;
-        }
-        
-        .stat-card .number {
-            font-size: 1.5em;
-        }
-        
-        .stat-card .label {
-            font-size: 0.85em;
-        }
-        
-        .tabs {
-            padding: 5px;
-            gap: 5px;
-        }
-        
-        .tab {
-            padding: 8px 12px;
-            font-size: 12px;
-        }
-        
-        .card, .tab-content {
-            padding: 12px 8px;
-            margin: 5px;
-        }
-        
-        .controls h2 {
-            font-size: 1.2em;
-        }
-        
-        .controls > div {
-            flex-direction: column;
-            gap: 10px;
-            align-items: stretch;
-        }
-        
-        .refresh-btn,
-        .auto-refresh {
-            width: 100%;
-            text-align: center;
-            justify-content: center;
-        }
-        
-        .setting-group {
-            margin-bottom: 15px;
-        }
-        
-        .conversation-item {
-            padding: 12px;
-        }
-    }
-    
-    /* Edge Case Handling - Ensure all content is bounded */
-    * {
-        box-sizing: border-box;
-    }
-    
-    .tab-content {
-        overflow-x: hidden;
-        word-wrap: break-word;
-        overflow-wrap: break-word;
-    }
-    
-    .controls > div {
-        max-width: 100%;
-    }
-    
-    h1, h2, h3, p, li {
-        word-wrap: break-word;
-        overflow-wrap: break-word;
-    }
-    
-    button {
-        max-width: 100%;
-    }
-    
-    .refresh-btn {
-        white-space: nowrap;
-    }
-</style>
-</head>
-<body>
-<div class="container">
-    <div class="header">
-        <h1>🎮 UE5 AI Assistant Dashboard</h1>
-        <p>Real-time conversation monitoring and analytics</p>
-        <div class="stats">
-            <div class="stat-card">
-                <div class="number" id="total-conversations">0</div>
-                <div class="label">Total Conversations</div>
-            </div>
-            <div class="stat-card">
-                <div class="number" id="recent-conversations">0</div>
-                <div class="label">Recent (Last 50)</div>
-            </div>
-            <div class="stat-card">
-                <div class="number" id="max-storage">100</div>
-                <div class="label">Max Storage</div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="tabs">
-        <button class="tab active" onclick="showTab('dashboard')">📊 Dashboard</button>
-        <button class="tab" onclick="showTab('settings')">⚙️ Settings</button>
-        <button class="tab" onclick="showTab('api')">🔧 API Info</button>
-        <button class="tab" onclick="showTab('about')">ℹ️ About</button>
-    </div>
-    
-    <div style="margin: 15px 0; padding: 15px; background: rgba(0, 217, 255, 0.1); border-radius: 8px; border: 1px solid rgba(0, 217, 255, 0.3);">
-        <strong style="color: #00d9ff;">🎮 NEW: Project Hub</strong> - 
-        <a href="/dashboard/project-hub" style="color: #00d9ff; text-decoration: underline;">
-            Query your project with AI & generate editor utilities →
-        </a>
-    </div>
-    
-    <div id="dashboard" class="tab-content active">
-        <div class="controls">
-            <h2>Recent Conversations</h2>
-            <div style="display: flex; gap: 15px; align-items: center;">
-                <label class="auto-refresh">
-                    <input type="checkbox" id="auto-refresh" checked>
-                    Auto-refresh (5s)
-                </label>
-                <button class="refresh-btn" onclick="loadConversations()">
-                    <span>🔄</span> Refresh Now
-                </button>
-            </div>
-        </div>
-        <div id="conversation-list" class="conversation-list">
-            <div class="empty-state">
-                <svg fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M8 12h.01M12 12h.01M16 12h.01M21 12c0 4.418-4.03 8-9 8a9.863 9.863 0 01-4.255-.949L3 20l1.395-3.72C3.512 15.042 3 13.574 3 12c0-4.418 4.03-8 9-8s9 3.582 9 8z"></path>
-                </svg>
-                <p>No conversations yet. Start using the AI Assistant in Unreal Engine!</p>
-            </div>
-        </div>
-    </div>
-    
-    <div id="settings" class="tab-content">
-        <h2>⚙️ Configuration Settings</h2>
-        <p style="margin: 15px 0; color: #666;">
-            Configure AI behavior and response style in real-time without code changes
-        </p>
-        
-        <div style="display: grid; gap: 25px; margin-top: 30px;">
-            <!-- AI Model Selection -->
-            <div class="setting-group">
-                <label class="setting-label">
-                    <strong>🤖 AI Model</strong>
-                    <span class="setting-description">Choose the GPT model for responses</span>
-                </label>
-                <select id="model" class="setting-input">
-                    <option value="gpt-4o-mini">GPT-4o Mini (Fast & Efficient)</option>
-                    <option value="gpt-4o">GPT-4o (Balanced)</option>
-                    <option value="gpt-4-turbo">GPT-4 Turbo (Powerful)</option>
-                    <option value="gpt-3.5-turbo">GPT-3.5 Turbo (Legacy)</option>
-                </select>
-            </div>
-            
-            <!-- Response Style -->
-            <div class="setting-group">
-                <label class="setting-label">
-                    <strong>📝 Response Style</strong>
-                    <span class="setting-description">Adjust how the AI communicates</span>
-                </label>
-                <select id="response_style" class="setting-input">
-                    <option value="descriptive">Descriptive (Default) - Clear and factual</option>
-                    <option value="technical">Technical/Precise - Highly technical with exact specs</option>
-                    <option value="natural">Natural/Conversational - Friendly and approachable</option>
-                    <option value="balanced">Balanced - Mix of technical and readable</option>
-                    <option value="concise">Concise/Brief - Short and to the point</option>
-                    <option value="detailed">Detailed/Verbose - Comprehensive analysis</option>
-                    <option value="creative">Creative/Imaginative - Vivid imagery and storytelling</option>
-                </select>
-            </div>
-            
-            <!-- Temperature -->
-            <div class="setting-group">
-                <label class="setting-label">
-                    <strong>🌡️ Temperature: <span id="temp-value">0.7</span></strong>
-                    <span class="setting-description">Higher = more creative, Lower = more focused</span>
-                </label>
-                <input type="range" id="temperature" class="setting-slider" min="0" max="1" step="0.1" value="0.7" 
-                       oninput="document.getElementById('temp-value').textContent = this.value">
-            </div>
-            
-            <!-- Max Context Turns -->
-            <div class="setting-group">
-                <label class="setting-label">
-                    <strong>💬 Max Context Turns: <span id="turns-value">6</span></strong>
-                    <span class="setting-description">Number of previous conversation turns to remember</span>
-                </label>
-                <input type="range" id="max_context_turns" class="setting-slider" min="2" max="20" step="1" value="6"
-                       oninput="document.getElementById('turns-value').textContent = this.value">
-            </div>
-            
-            <!-- Timeout -->
-            <div class="setting-group">
-                <label class="setting-label">
-                    <strong>⏱️ Request Timeout: <span id="timeout-value">25</span>s</strong>
-                    <span class="setting-description">Maximum time to wait for API response</span>
-                </label>
-                <input type="range" id="timeout" class="setting-slider" min="10" max="60" step="5" value="25"
-                       oninput="document.getElementById('timeout-value').textContent = this.value">
-            </div>
-            
-            <!-- Save Button -->
-            <div style="display: flex; gap: 15px; margin-top: 10px;">
-                <button onclick="saveSettings()" class="save-btn">
-                    💾 Save Settings
-                </button>
-                <button onclick="resetSettings()" class="reset-btn">
-                    🔄 Reset to Defaults
-                </button>
-            </div>
-            
-            <div id="save-status" class="save-status"></div>
-            
-            <!-- Conversation History Management -->
-            <div class="setting-group" style="margin-top: 30px; border: 2px solid rgba(231, 76, 60, 0.5); background: rgba(231, 76, 60, 0.05);">
-                <label class="setting-label">
-                    <strong>🗑️ Conversation History</strong>
-                    <span class="setting-description" style="color: #ef4444;">
-                        Clear all stored conversations (both memory and persistent file)
-                    </span>
-                </label>
-                <button onclick="clearHistory()" class="clear-history-btn" style="background: rgba(231, 76, 60, 0.2); color: #ef4444; padding: 12px 24px; border: 1px solid #ef4444; border-radius: 8px; font-size: 16px; font-weight: 600; cursor: pointer; width: 100%; transition: all 0.3s;">
-                    🗑️ Clear All Conversations
-                </button>
-            </div>
-        </div>
-    </div>
-    
-    <div id="api" class="tab-content">
-        <h2>API Endpoints (v3.1)</h2>
-        <p style="margin: 15px 0; color: #94a3b8;">Comprehensive API endpoints for the UE5 AI Assistant:</p>
-        
-        <h3 style="color: #00f5ff; margin-top: 25px; margin-bottom: 10px;">Core Endpoints</h3>
-        <ul style="list-style: none; line-height: 2;">
-            <li><strong style="color: #00f5ff;">GET /health</strong> <span style="color: #94a3b8;">- Health check & version info</span></li>
-            <li><strong style="color: #00f5ff;">POST /execute_command</strong> <span style="color: #94a3b8;">- Execute AI commands with context</span></li>
-            <li><strong style="color: #00f5ff;">POST /describe_viewport</strong> <span style="color: #94a3b8;">- Generate technical viewport descriptions</span></li>
-            <li><strong style="color: #00f5ff;">GET /ping_openai</strong> <span style="color: #94a3b8;">- Test OpenAI connectivity</span></li>
-        </ul>
-        
-        <h3 style="color: #00f5ff; margin-top: 25px; margin-bottom: 10px;">File System Operations (v3.1)</h3>
-        <ul style="list-style: none; line-height: 2;">
-            <li><strong style="color: #00f5ff;">POST /api/files/list</strong> <span style="color: #94a3b8;">- Browse project files (secure, read-only)</span></li>
-            <li><strong style="color: #00f5ff;">POST /api/files/read</strong> <span style="color: #94a3b8;">- Read file contents (path validated)</span></li>
-            <li><strong style="color: #00f5ff;">POST /api/files/search</strong> <span style="color: #94a3b8;">- Search files by pattern</span></li>
-        </ul>
-        
-        <h3 style="color: #00f5ff; margin-top: 25px; margin-bottom: 10px;">Project Intelligence (v3.1)</h3>
-        <ul style="list-style: none; line-height: 2;">
-            <li><strong style="color: #00f5ff;">GET /api/project/metadata</strong> <span style="color: #94a3b8;">- Get project profile & stats</span></li>
-            <li><strong style="color: #00f5ff;">POST /api/project/metadata</strong> <span style="color: #94a3b8;">- Update project metadata</span></li>
-            <li><strong style="color: #00f5ff;">POST /api/guidance</strong> <span style="color: #94a3b8;">- Context-aware implementation guidance</span></li>
-        </ul>
-        
-        <h3 style="color: #00f5ff; margin-top: 25px; margin-bottom: 10px;">Blueprint Vision (v3.1)</h3>
-        <ul style="list-style: none; line-height: 2;">
-            <li><strong style="color: #00f5ff;">POST /api/blueprints/capture</strong> <span style="color: #94a3b8;">- Capture & analyze Blueprint screenshots (multi-modal)</span></li>
-            <li><strong style="color: #00f5ff;">GET /api/blueprints/{id}</strong> <span style="color: #94a3b8;">- Retrieve Blueprint capture by ID</span></li>
-            <li><strong style="color: #00f5ff;">GET /api/blueprints</strong> <span style="color: #94a3b8;">- List all Blueprint captures</span></li>
-        </ul>
-        
-        <h3 style="color: #00f5ff; margin-top: 25px; margin-bottom: 10px;">Configuration & Data</h3>
-        <ul style="list-style: none; line-height: 2;">
-            <li><strong style="color: #00f5ff;">GET /api/config</strong> <span style="color: #94a3b8;">- Get current configuration</span></li>
-            <li><strong style="color: #00f5ff;">POST /api/config</strong> <span style="color: #94a3b8;">- Update configuration</span></li>
-            <li><strong style="color: #00f5ff;">GET /api/conversations</strong> <span style="color: #94a3b8;">- Retrieve conversation history</span></li>
-            <li><strong style="color: #00f5ff;">DELETE /api/conversations</strong> <span style="color: #94a3b8;">- Clear conversation history</span></li>
-            <li><strong style="color: #00f5ff;">GET /dashboard</strong> <span style="color: #94a3b8;">- Interactive web dashboard</span></li>
-        </ul>
-    </div>
-    
-    <div id="about" class="tab-content">
-        <h2>About UE5 AI Assistant v3.1</h2>
-        
-        <h3 style="color: #00f5ff; margin-top: 20px; margin-bottom: 10px;">Overview</h3>
-        <p style="margin: 15px 0; line-height: 1.8; color: #cbd5e1;">
-            Advanced AI-powered assistant for Unreal Engine 5.6+ with comprehensive project intelligence, 
-            multi-modal Blueprint vision analysis, secure file system operations, and context-aware 
-            implementation guidance. Seamlessly integrates with UE5 Python environment via FastAPI backend.
-        </p>
-        
-        <h3 style="color: #00f5ff; margin-top: 25px; margin-bottom: 10px;">Key Capabilities</h3>
-        <ul style="line-height: 2; color: #cbd5e1;">
-            <li><strong style="color: #00f5ff;">Viewport Analysis:</strong> Technical prose generation from 3D scene data with 7 customizable response styles</li>
-            <li><strong style="color: #00f5ff;">Blueprint Vision:</strong> Multi-modal AI analysis of Blueprint screenshots using GPT-4o vision API</li>
-            <li><strong style="color: #00f5ff;">Project Intelligence:</strong> Automated extraction of modules, plugins, assets, and source code statistics</li>
-            <li><strong style="color: #00f5ff;">File Operations:</strong> Secure read-only file browsing with path traversal protection</li>
-            <li><strong style="color: #00f5ff;">Implementation Guidance:</strong> Context-aware AI recommendations tailored to your project structure</li>
-            <li><strong style="color: #00f5ff;">Conversation Persistence:</strong> Full history with JSONL storage and real-time monitoring</li>
-        </ul>
-        
-        <h3 style="color: #00f5ff; margin-top: 25px; margin-bottom: 10px;">System Info</h3>
-        <p style="margin: 15px 0; line-height: 1.8; color: #cbd5e1;">
-            <strong style="color: #00f5ff;">Version:</strong> 3.1 (Advanced Context & Testing Infrastructure)<br>
-            <strong style="color: #00f5ff;">Model:</strong> <span id="current-model-display">Loading...</span><br>
-            <strong style="color: #00f5ff;">Backend:</strong> FastAPI + Python 3.11.9<br>
-            <strong style="color: #00f5ff;">UE5 Integration:</strong> Python 3.11.8 (UE5.6 API Compliant)<br>
-            <strong style="color: #00f5ff;">AI Provider:</strong> OpenAI (GPT-4o, GPT-4o-mini)<br>
-            <strong style="color: #00f5ff;">Project by:</strong> Noah Butcher
-        </p>
-        
-        <h3 style="color: #00f5ff; margin-top: 25px; margin-bottom: 10px;">Architecture</h3>
-        <p style="margin: 15px 0; line-height: 1.8; color: #cbd5e1;">
-            Modular FastAPI backend with specialized services for file systems, guidance generation, 
-            and OpenAI integration. UE5 client features file collection, Blueprint capture, project metadata 
-            extraction, and action execution. Includes complete mock testing environment for Replit-based 
-            development without UE5 editor dependency.
-        </p>
-    </div>
-</div>
-
-<script>
-    let autoRefreshInterval = null;
-    
-    function showTab(tabName) {
-        // Hide all tabs
-        document.querySelectorAll('.tab-content').forEach(tab => {
-            tab.classList.remove('active');
-        });
-        document.querySelectorAll('.tab').forEach(btn => {
-            btn.classList.remove('active');
-        });
-        
-        // Show selected tab
-        document.getElementById(tabName).classList.add('active');
-        event.target.classList.add('active');
-    }
-    
-    function formatTimestamp(isoString) {
-        const date = new Date(isoString);
-        return date.toLocaleString();
-    }
-    
-    function truncateText(text, maxLength = 300) {
-        if (text.length <= maxLength) return text;
-        return text.substring(0, maxLength) + '...';
-    }
-    
-    async function loadConversations() {
-        try {
-            const response = await fetch(`${window.location.origin}/api/conversations?limit=50`);
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            const data = await response.json();
-            
-            // Update stats
-            document.getElementById('total-conversations').textContent = data.total;
-            document.getElementById('recent-conversations').textContent = data.conversations.length;
-            document.getElementById('max-storage').textContent = data.max_size;
-            
-            // Render conversations
-            const listElement = document.getElementById('conversation-list');
-            
-            if (data.conversations.length === 0) {
-                listElement.innerHTML = `
-                    <div class="empty-state">
-                        <svg fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M8 12h.01M12 12h.01M16 12h.01M21 12c0 4.418-4.03 8-9 8a9.863 9.863 0 01-4.255-.949L3 20l1.395-3.72C3.512 15.042 3 13.574 3 12c0-4.418 4.03-8 9-8s9 3.582 9 8z"></path>
-                        </svg>
-                        <p>No conversations yet. Start using the AI Assistant in Unreal Engine!</p>
-                    </div>
-                `;
-                return;
-            }
-            
-            listElement.innerHTML = data.conversations.map(conv => `
-                <div class="conversation-item">
-                    <div class="conversation-header">
-                        <span class="command-type">${conv.command_type}</span>
-                        <span class="timestamp">${formatTimestamp(conv.timestamp)}</span>
-                    </div>
-                    <div class="user-input">
-                        <strong>User:</strong> ${conv.user_input}
-                    </div>
-                    <div class="assistant-response">
-                        <strong>Assistant:</strong> ${truncateText(conv.assistant_response)}
-                    </div>
-                </div>
-            `).join('');
-            
-        } catch (error) {
-            console.error('Failed to load conversations:', error);
-        }
-    }
-    
-    // Auto-refresh toggle
-    document.getElementById('auto-refresh').addEventListener('change', function(e) {
-        if (e.target.checked) {
-            autoRefreshInterval = setInterval(loadConversations, 5000);
-        } else {
-            if (autoRefreshInterval) {
-                clearInterval(autoRefreshInterval);
-                autoRefreshInterval = null;
-            }
-        }
-    });
-    
-    // Initial load
-    loadConversations();
-    
-    // Start auto-refresh
-    autoRefreshInterval = setInterval(loadConversations, 5000);
-    
-    // ============================================================
-    // SETTINGS FUNCTIONS
-    // ============================================================
-    
-    async function loadSettings() {
-        try {
-            const response = await fetch(`${window.location.origin}/api/config`);
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            const data = await response.json();
-            const config = data.config;
-            
-            // Populate form fields
-            document.getElementById('model').value = config.model || 'gpt-4o-mini';
-            
-            // Update About page with current model
-            const modelDisplay = document.getElementById('current-model-display');
-            if (modelDisplay) {
-                const modelNames = {
-                    'gpt-4o-mini': 'GPT-4o Mini (Fast & Efficient)',
-                    'gpt-4o': 'GPT-4o (Balanced)',
-                    'gpt-4-turbo': 'GPT-4 Turbo (Powerful)',
-                    'gpt-3.5-turbo': 'GPT-3.5 Turbo (Legacy)'
-                };
-                modelDisplay.textContent = modelNames[config.model] || config.model;
-                modelDisplay.style.color = '#00f5ff';
-            }
-            document.getElementById('response_style').value = config.response_style || 'descriptive';
-            document.getElementById('temperature').value = config.temperature || 0.7;
-            document.getElementById('temp-value').textContent = config.temperature || 0.7;
-            document.getElementById('max_context_turns').value = config.max_context_turns || 6;
-            document.getElementById('turns-value').textContent = config.max_context_turns || 6;
-            document.getElementById('timeout').value = config.timeout || 25;
-            document.getElementById('timeout-value').textContent = config.timeout || 25;
-            
-            console.log('Settings loaded:', config);
-        } catch (error) {
-            console.error('Failed to load settings:', error);
-            showStatus('Failed to load settings', 'error');
-        }
-    }
-    
-    async function saveSettings() {
-        const statusEl = document.getElementById('save-status');
-        
-        try {
-            const settings = {
-                model: document.getElementById('model').value,
-                response_style: document.getElementById('response_style').value,
-                temperature: parseFloat(document.getElementById('temperature').value),
-                max_context_turns: parseInt(document.getElementById('max_context_turns').value),
-                timeout: parseInt(document.getElementById('timeout').value)
-            };
-            
-            const response = await fetch(`${window.location.origin}/api/config`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify(settings)
-            });
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            
-            const result = await response.json();
-            
-            if (result.success) {
-                showStatus('✅ Settings saved successfully!', 'success');
-            } else {
-                showStatus('❌ Failed to save settings', 'error');
-            }
-        } catch (error) {
-            console.error('Failed to save settings:', error);
-            showStatus('❌ Error: ' + error.message, 'error');
-        }
-    }
-    
-    async function resetSettings() {
-        if (!confirm('Reset all settings to defaults?')) return;
-        
-        try {
-            const response = await fetch(`${window.location.origin}/api/config`);
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            const data = await response.json();
-            const defaults = data.defaults;
-            
-            // Reset to defaults
-            const settings = {
-                model: defaults.model,
-                response_style: defaults.response_style,
-                temperature: defaults.temperature,
-                max_context_turns: defaults.max_context_turns,
-                timeout: defaults.timeout
-            };
-            
-            const saveResponse = await fetch(`${window.location.origin}/api/config`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify(settings)
-            });
-            
-            if (saveResponse.ok) {
-                loadSettings(); // Reload to update UI
-                showStatus('✅ Settings reset to defaults', 'success');
-            } else {
-                showStatus('❌ Failed to reset settings', 'error');
-            }
-        } catch (error) {
-            console.error('Failed to reset settings:', error);
-            showStatus('❌ Error: ' + error.message, 'error');
-        }
-    }
-    
-    async function clearHistory() {
-        if (!confirm('⚠️ Are you sure you want to delete ALL conversation history? This cannot be undone.')) {
-            return;
-        }
-        
-        try {
-            const response = await fetch(`${window.location.origin}/api/conversations`, {
-                method: 'DELETE'
-            });
-            
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            
-            const result = await response.json();
-            
-            if (result.success) {
-                showStatus('✅ All conversation history cleared', 'success');
-                // Refresh conversation list
-                loadConversations();
-            } else {
-                showStatus('❌ ' + result.message, 'error');
-            }
-        } catch (error) {
-            console.error('Failed to clear history:', error);
-            showStatus('❌ Error: ' + error.message, 'error');
-        }
-    }
-    
-    function showStatus(message, type) {
-        const statusEl = document.getElementById('save-status');
-        statusEl.textContent = message;
-        statusEl.className = 'save-status ' + type;
-        
-        // Clear after 3 seconds
-        setTimeout(() => {
-            statusEl.textContent = '';
-            statusEl.className = 'save-status';
-        }, 3000);
-    }
-    
-    // Load settings when opening settings tab
-    document.querySelectorAll('.tab').forEach(tab => {
-        tab.addEventListener('click', function() {
-            if (this.textContent.includes('Settings')) {
-                loadSettings();
-            }
-        });
-    });
-</script>
-</body>
-</html>
-"""
+"""Dashboard HTML templates for the UE5 AI Assistant."""
+import gzip
+import hashlib
+import os
+import re
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, Response
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    brotli = None  # type: ignore  # Optional dependency
+    HAS_BROTLI = False
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+# URL prefix the extracted template assets are served under
+ASSET_URL_PREFIX = "/static/"
+
+# Browsers keep the page but revalidate it with If-None-Match on every
+# load, which costs an empty 304 while the template is unchanged
+PAGE_CACHE_CONTROL = "public, no-cache"
+
+# Rules after this comment in a <style> block are not needed for first
+# paint; they move to a stylesheet that loads without blocking rendering
+DEFERRED_CSS_MARKER = "/* @deferred */"
+
+# Asset names carry a content hash, so browsers may keep them forever
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_ASSET_MEDIA_TYPES = {
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+}
+
+
+class _Payload(NamedTuple):
+    """Encoded bytes plus their pre-compressed variants."""
+    body: bytes
+    gzip_body: bytes
+    br_body: Optional[bytes]
+    etag: str  # Strong validator of the plain body; variants add a suffix
+
+
+def _compress(body: bytes) -> _Payload:
+    """Pre-compute the compressed variants and ETag of a payload."""
+    return _Payload(
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=9),
+        br_body=brotli.compress(body, quality=11) if HAS_BROTLI else None,
+        etag=hashlib.sha1(body).hexdigest(),
+    )
+
+
+# Quoted strings are matched first so their contents are never rewritten
+_CSS_STRING = r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')"""
+_CSS_COLLAPSE_RE = re.compile(_CSS_STRING + r"|/\*.*?\*/|\s+", re.DOTALL)
+_CSS_TRIM_RE = re.compile(_CSS_STRING + r"|;\s*(?=})|\s*([{};,>])\s*")
+_STYLE_BLOCK_RE = re.compile(r"(<style[^>]*>)(.*?)(</style>)",
+                             re.DOTALL | re.IGNORECASE)
+# Only attribute-less scripts are inline code; <script src=...> is left alone
+_INLINE_SCRIPT_RE = re.compile(r"<script>(.*?)</script>", re.DOTALL)
+_ASSET_NAME_RE = re.compile(r"([\w-]+)\.[0-9a-f]{12}\.\w+")
+
+
+def minify_css(css: str) -> str:
+    """
+    Strip comments and redundant whitespace from a stylesheet.
+
+    Spaces after colons are kept, so selectors such as ``.a :hover`` keep
+    their meaning.
+    """
+    css = _CSS_COLLAPSE_RE.sub(lambda m: m.group(1) or " ", css)
+    css = _CSS_TRIM_RE.sub(lambda m: m.group(1) or m.group(2) or "", css)
+    return css.strip()
+
+
+def _minify_inline_css(html: str) -> str:
+    """Minify every <style> block of an HTML document."""
+    return _STYLE_BLOCK_RE.sub(
+        lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), html)
+
+
+def _extract_deferred_css(stem: str, html: str) -> Tuple[str, Dict[str, bytes]]:
+    """
+    Split <style> blocks at DEFERRED_CSS_MARKER into inline and deferred CSS.
+
+    The rules before the marker stay inline. The rest becomes a minified
+    ``<stem>.<hash>.css`` asset, linked with ``media="print"`` and switched
+    to ``all`` once loaded, so it is fetched without blocking first paint.
+    The link follows the <style> block, so the cascade order is unchanged.
+
+    Returns:
+        The rewritten HTML and a mapping of asset name -> stylesheet bytes.
+    """
+    assets = {}
+
+    def replace(match):
+        critical, marker, deferred = match.group(2).partition(DEFERRED_CSS_MARKER)
+        if not marker:
+            return match.group(0)
+        css = minify_css(deferred).encode("utf-8")
+        asset = f"{stem}.{hashlib.sha1(css).hexdigest()[:12]}.css"
+        assets[asset] = css
+        href = f"{ASSET_URL_PREFIX}{asset}"
+        return (match.group(1) + critical + match.group(3)
+                + f'<link rel="stylesheet" href="{href}" media="print" '
+                f'onload="this.media=\'all\'">'
+                f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+    return _STYLE_BLOCK_RE.sub(replace, html), assets
+
+
+def _extract_scripts(stem: str, html: str) -> Tuple[str, Dict[str, bytes]]:
+    """
+    Move inline <script> blocks out into separately cacheable assets.
+
+    Each block becomes ``<stem>.<hash>.js`` and is replaced by a deferred
+    <script src>. Deferred scripts still run before DOMContentLoaded, and
+    the inline ones sat at the end of <body>, so execution order is kept.
+
+    Returns:
+        The rewritten HTML and a mapping of asset name -> script bytes.
+    """
+    assets = {}
+
+    def replace(match):
+        script = match.group(1).encode("utf-8")
+        asset = f"{stem}.{hashlib.sha1(script).hexdigest()[:12]}.js"
+        assets[asset] = script
+        return f'<script defer src="{ASSET_URL_PREFIX}{asset}"></script>'
+
+    return _INLINE_SCRIPT_RE.sub(replace, html), assets
+
+
+# Template name -> (st_mtime_ns, st_size, page, names of its assets)
+_TEMPLATE_CACHE: Dict[str, Tuple[int, int, _Payload, List[str]]] = {}
+
+# Asset name -> payload, for every template loaded so far
+_ASSETS: Dict[str, _Payload] = {}
+
+
+def _load_page(name: str) -> _Payload:
+    """
+    Read, minify and compress a template, reusing the cached copy if
+    unchanged.
+
+    Minification, CSS and script extraction and compression run once per
+    file change rather than once per request.
+    """
+    path = os.path.join(TEMPLATES_DIR, name)
+    st = os.stat(path)
+    cached = _TEMPLATE_CACHE.get(name)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    stem = os.path.splitext(name)[0]
+    with open(path, encoding="utf-8") as f:
+        html, styles = _extract_deferred_css(stem, f.read())
+    html, scripts = _extract_scripts(stem, _minify_inline_css(html))
+    assets = {**styles, **scripts}
+
+    if cached:
+        for asset in cached[3]:
+            _ASSETS.pop(asset, None)
+    for asset, content in assets.items():
+        _ASSETS[asset] = _compress(content)
+    page = _compress(html.encode("utf-8"))
+    _TEMPLATE_CACHE[name] = (st.st_mtime_ns, st.st_size, page, list(assets))
+    return page
+
+
+def _is_current(name: str) -> bool:
+    """Check whether a template's cached build matches the file on disk."""
+    cached = _TEMPLATE_CACHE.get(name)
+    if cached is None:
+        return False
+    try:
+        st = os.stat(os.path.join(TEMPLATES_DIR, name))
+    except OSError:
+        return False
+    return cached[:2] == (st.st_mtime_ns, st.st_size)
+
+
+async def prepare_page(name: str) -> None:
+    """
+    Build a template in a worker thread unless its cached copy is current.
+
+    Minifying and compressing a page (gzip level 9, plus brotli level 11
+    when installed) takes long enough to stall every other request if it
+    runs on the event loop. Async handlers await this before building
+    their response, so the response itself only hits the cache.
+    """
+    if not _is_current(name):
+        await run_in_threadpool(_load_page, name)
+
+
+def load_template(name: str) -> bytes:
+    """
+    Return the UTF-8 encoded contents of an HTML template in app/templates.
+
+    The file is read once and kept in memory until its mtime or size
+    changes, so page requests cost a stat() instead of a 150 KB read. The
+    bytes are served as-is, with no per-request decode or encode.
+    """
+    return _load_page(name).body
+
+
+def _accepted_encodings(header: str) -> FrozenSet[str]:
+    """Parse an Accept-Encoding header, skipping codings refused with q=0."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return frozenset(accepted)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag
+               for tag in header.split(","))
+
+
+def _negotiated_response(payload: _Payload, request: Request,
+                         media_type: str, cache_control: str) -> Response:
+    """
+    Serve a payload, picking the best encoding the client accepts.
+
+    Brotli is preferred over gzip, then the plain bytes. A request whose
+    If-None-Match carries the selected ETag is answered with an empty 304.
+    """
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+
+    if payload.br_body is not None and "br" in accepted:
+        encoding, body, etag = "br", payload.br_body, f'"{payload.etag}-br"'
+    elif "gzip" in accepted:
+        encoding, body, etag = "gzip", payload.gzip_body, f'"{payload.etag}-gz"'
+    else:
+        encoding, body, etag = None, payload.body, f'"{payload.etag}"'
+
+    headers = {
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+        "ETag": etag,
+    }
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def template_response(name: str, request: Request) -> Response:
+    """Build the HTTP response for an HTML template in app/templates."""
+    return _negotiated_response(_load_page(name), request,
+                                HTMLResponse.media_type, PAGE_CACHE_CONTROL)
+
+
+def _asset_template(filename: str) -> Optional[str]:
+    """Return the template an asset name refers to, if that template exists."""
+    match = _ASSET_NAME_RE.fullmatch(filename)
+    template = match and f"{match.group(1)}.html"
+    if template and os.path.isfile(os.path.join(TEMPLATES_DIR, template)):
+        return template
+    return None
+
+
+async def prepare_asset(filename: str) -> None:
+    """Build the template providing an unknown asset in a worker thread."""
+    if filename not in _ASSETS:
+        template = _asset_template(filename)
+        if template:
+            await prepare_page(template)
+
+
+def asset_response(filename: str, request: Request) -> Optional[Response]:
+    """
+    Build the HTTP response for an asset extracted from a template.
+
+    Assets are registered when their template is loaded. Another worker
+    process may have served the page, so an unknown asset triggers a load
+    of the template named by its prefix before giving up.
+
+    Returns:
+        The response, or None if no template provides the asset.
+    """
+    payload = _ASSETS.get(filename)
+    if payload is None:
+        template = _asset_template(filename)
+        if template:
+            _load_page(template)
+            payload = _ASSETS.get(filename)
+    if payload is None:
+        return None
+
+    media_type = _ASSET_MEDIA_TYPES[os.path.splitext(filename)[1]]
+    return _negotiated_response(payload, request, media_type,
+                                ASSET_CACHE_CONTROL)
@@ -44,6 +44,7 @@ class ConfigUpdate(BaseModel):
     retry_delay: Optional[float] = None
     verbose: Optional[bool] = None
     response_style: Optional[str] = None
+    cache_responses: Optional[bool] = None
 
 
 class FileEntry(BaseModel):
@@ -85,8 +86,8 @@ class BlueprintCapture(BaseModel):
     blueprint_name: str
     blueprint_path: str
     capture_id: str
-    image_base64: Optional[str] = None
-    image_url: Optional[str] = None
+    image_base64: Optional[str] = None  # Inline PNG; keep to small captures
+    image_url: Optional[str] = None  # Preferred for full-size screenshots
     metadata: Optional[Dict[str, Any]] = None  # Graph info, node count, etc.
     timestamp: str
 
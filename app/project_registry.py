@@ -2,9 +2,19 @@
 Project Registry - Manages connected UE5 projects
 """
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore  # Optional dependency
+    HAS_ORJSON = False
 
 
 class ProjectRegistry:
@@ -17,6 +27,11 @@ class ProjectRegistry:
             "data/project_registry.json")
         # Ensure parent directory exists
         self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+        # Bytes last read from or written to registry_file
+        self._last_serialized: Optional[bytes] = None
+        # Set by bulk_update(): saves are deferred to the end of the block
+        self._save_suspended = False
+        self._pending_save = False
         self._load_registry()
 
     def _normalize_path(self, path: str) -> str:
@@ -75,10 +90,12 @@ class ProjectRegistry:
             if 'connection_mode' not in project_data:
                 project_data['connection_mode'] = existing_mode
 
+        # One timestamp for the whole registration
+        now = datetime.now().isoformat()
+
         # Get existing registration time or use current time
         registered_at = self.projects.get(project_id,
-                                          {}).get("registered_at",
-                                                  datetime.now().isoformat())
+                                          {}).get("registered_at", now)
 
         # Preserve existing session_messages if updating
         existing_session = None
@@ -93,7 +110,7 @@ class ProjectRegistry:
             "version": project_data.get("version", "5.6"),
             "metadata": project_data.get("metadata", {}),
             "registered_at": registered_at,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now,
             "session_messages": existing_session or []  # Per-project conversation history
         }
 
@@ -116,6 +133,41 @@ class ProjectRegistry:
             "is_active": self.active_project_id == project_id
         }
 
+    def register_projects(
+            self, batch: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Register or update several UE5 projects with a single save.
+
+        Args:
+            batch: Project metadata keyed by project identifier
+
+        Returns:
+            Registration result for each project, in batch order
+        """
+        with self.bulk_update():
+            return [self.register_project(project_id, project_data)
+                    for project_id, project_data in batch.items()]
+
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """
+        Defer saving until the end of the block.
+
+        Mutations inside the block are written to disk once on exit, even
+        if the block raises. Nested blocks save when the outermost exits.
+        """
+        if self._save_suspended:
+            yield
+            return
+        self._save_suspended = True
+        try:
+            yield
+        finally:
+            self._save_suspended = False
+            if self._pending_save:
+                self._pending_save = False
+                self._save_registry()
+
     def delete_project(self, project_id: str) -> Dict[str, Any]:
         """
         Delete a project from the registry.
@@ -188,9 +240,9 @@ class ProjectRegistry:
 
     def list_projects(self) -> List[Dict[str, Any]]:
         """List all registered projects."""
+        active_id = self.active_project_id
         return [{
-            **project, "is_active":
-            project["project_id"] == self.active_project_id
+            **project, "is_active": project["project_id"] == active_id
         } for project in self.projects.values()]
 
     def update_project_metadata(self, project_id: str,
@@ -283,26 +335,55 @@ class ProjectRegistry:
         }
 
     def _save_registry(self):
-        """Save registry to disk."""
+        """
+        Save registry to disk.
+
+        Nothing is written if the encoded registry matches what is already
+        on disk. Otherwise it goes to a temp file that replaces the registry
+        atomically, so a crash mid-write cannot truncate it.
+        """
+        if self._save_suspended:
+            self._pending_save = True
+            return
+
         data = {
             "active_project_id": self.active_project_id,
             "projects": self.projects
         }
 
+        tmp_path = None
         try:
-            with open(self.registry_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if HAS_ORJSON:
+                encoded = orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                encoded = json.dumps(data, indent=2).encode()
+            if encoded == self._last_serialized:
+                return
+            with tempfile.NamedTemporaryFile('wb',
+                                             dir=self.registry_file.parent,
+                                             prefix=self.registry_file.name,
+                                             suffix='.tmp',
+                                             delete=False) as f:
+                tmp_path = f.name
+                f.write(encoded)
+            os.replace(tmp_path, self.registry_file)
+            self._last_serialized = encoded
         except Exception as e:
             print(f"Failed to save registry: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
 
     def _load_registry(self):
         """Load registry from disk."""
         if self.registry_file.exists():
             try:
-                with open(self.registry_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.registry_file, 'rb') as f:
+                    raw = f.read()
+                    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
                     self.active_project_id = data.get("active_project_id")
                     self.projects = data.get("projects", {})
+                    self._last_serialized = raw
             except Exception as e:
                 print(f"Failed to load registry: {e}")
 
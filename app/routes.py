@@ -1,10 +1,47 @@
 """API routes for the UE5 AI Assistant backend."""
-from typing import Any, Dict, List, Optional, cast
-
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import traceback
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import openai
 from fastapi import HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
+from pydantic import ValidationError
 
-from app.config import DEFAULT_CONFIG, RESPONSE_STYLES
+from app.config import (
+    DEFAULT_CONFIG,
+    HAS_ORJSON,
+    RESPONSE_STYLES,
+    get_style,
+)
+from app.dashboard import (
+    asset_response,
+    prepare_asset,
+    prepare_page,
+    template_response,
+)
 from app.models import (
     BlueprintCapture,
     ConfigUpdate,
@@ -13,20 +50,50 @@ from app.models import (
     ProjectProfile,
     ViewportContext,
 )
+from app.project_registry import get_registry
 from app.services import conversation
 from app.services.file_system import FileSystemService
 from app.services.filtering import filter_viewport_data
 from app.services.guidance import GuidanceService
+from app.services.llm_cache import caching_enabled
 from app.services.openai_client import (
+    call_openai_chat,
     generate_viewport_description,
     test_openai_connection,
+    to_prompt_json,
 )
+from app.websocket_manager import get_manager
+
+# orjson encodes responses several times faster than the stdlib encoder;
+# handlers returning plain JSON data can also build it directly to skip
+# jsonable_encoder
+JSON_RESPONSE_CLASS = ORJSONResponse if HAS_ORJSON else JSONResponse
+
+
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """Compile keywords into one alternation matching any of them."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Keyword groups for /execute_command routing, matched against the
+# lowercased prompt; each group is one regex scan instead of one
+# substring scan per keyword
+_VIEWPORT_QUERY_RE = _keyword_pattern(
+    "what do i see", "viewport", "describe viewport", "scene")
+_ACTOR_LIST_QUERY_RE = _keyword_pattern("list actors", "list of actors")
+_PROJECT_QUERY_RE = _keyword_pattern(
+    "my project", "project name", "project called", "what am i working on",
+    "current project", "this project", "project info", "breakdown")
+_CAPTURE_QUERY_RE = _keyword_pattern(
+    "capture", "screenshot", "screen shot", "show blueprint", "picture of",
+    "image of")
+_BLUEPRINT_TERM_RE = _keyword_pattern("blueprint", "bp_", "graph", "node")
+_FILE_BROWSE_QUERY_RE = _keyword_pattern(
+    "show files", "list files", "browse files", "what files", "project files")
 
 
 def sanitize_class_name(name: str) -> str:
     """Convert user input to valid Python class name."""
-    import re
-    
     # Remove any characters that aren't alphanumeric or underscores
     clean_name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
     
@@ -49,58 +116,77 @@ def sanitize_class_name(name: str) -> str:
 # Template function removed - widget generation now uses OpenAI API for dynamic, AI-generated scripts
 
 
+# Instructions shared by every response style; the style's prompt
+# modifier is appended to form the system message
+_BASE_SYSTEM_MSG = (
+    "You are an AI assistant for Unreal Engine 5.6. "
+    "Generate structured prose describing editor state and "
+    "scene contents. "
+    "Use terminology appropriate for UE5, include specific "
+    "names and values. "
+    "\n\n"
+    "IMPORTANT CAPABILITIES:\n"
+    "When users ask about THEIR specific project/editor state, "
+    "you can trigger real-time data collection by responding "
+    "with [UE_REQUEST] tokens:\n"
+    "\n"
+    "VIEWPORT & SCENE:\n"
+    "- [UE_REQUEST] describe_viewport - When user asks "
+    "'describe my viewport', 'what's in my scene', "
+    "'describe what I see'\n"
+    "  Use this for 3D viewport scene description, actors, "
+    "lighting, camera\n"
+    "\n"
+    "BLUEPRINTS:\n"
+    "- [UE_REQUEST] capture_blueprint - ONLY when user "
+    "explicitly asks to 'capture blueprint' or "
+    "'screenshot blueprint'\n"
+    "  Requires Blueprint Editor to be open. NOT for "
+    "viewport description!\n"
+    "- [UE_REQUEST] list_blueprints - List all Blueprint "
+    "assets in project\n"
+    "\n"
+    "PROJECT INFO:\n"
+    "- [UE_REQUEST] get_project_info - Get project name, "
+    "modules, blueprints count\n"
+    "- [UE_REQUEST] browse_files - Browse project file "
+    "structure and count files\n"
+    "\n"
+    "CRITICAL: 'describe viewport' = describe_viewport, "
+    "NOT capture_blueprint!\n"
+    "\n"
+    "For GENERAL advice (e.g., 'how do I create a C++ file'), "
+    "provide helpful guidance without tokens. "
+)
+
+# Style prompt modifier -> full system message; styles are immutable, so
+# entries never go stale
+_SYSTEM_MSG_CACHE: Dict[str, str] = {}
+
+
 def get_system_message(app_config: Dict[str, Any]) -> str:
     """Generate system message with current response style."""
     current_style = app_config.get("response_style", "descriptive")
-    style_config = RESPONSE_STYLES.get(current_style,
-                                       RESPONSE_STYLES["descriptive"])
-    style_modifier = style_config["prompt_modifier"]
-
-    base_msg = ("You are an AI assistant for Unreal Engine 5.6. "
-                "Generate structured prose describing editor state and "
-                "scene contents. "
-                "Use terminology appropriate for UE5, include specific "
-                "names and values. "
-                "\n\n"
-                "IMPORTANT CAPABILITIES:\n"
-                "When users ask about THEIR specific project/editor state, "
-                "you can trigger real-time data collection by responding "
-                "with [UE_REQUEST] tokens:\n"
-                "\n"
-                "VIEWPORT & SCENE:\n"
-                "- [UE_REQUEST] describe_viewport - When user asks "
-                "'describe my viewport', 'what's in my scene', "
-                "'describe what I see'\n"
-                "  Use this for 3D viewport scene description, actors, "
-                "lighting, camera\n"
-                "\n"
-                "BLUEPRINTS:\n"
-                "- [UE_REQUEST] capture_blueprint - ONLY when user "
-                "explicitly asks to 'capture blueprint' or "
-                "'screenshot blueprint'\n"
-                "  Requires Blueprint Editor to be open. NOT for "
-                "viewport description!\n"
-                "- [UE_REQUEST] list_blueprints - List all Blueprint "
-                "assets in project\n"
-                "\n"
-                "PROJECT INFO:\n"
-                "- [UE_REQUEST] get_project_info - Get project name, "
-                "modules, blueprints count\n"
-                "- [UE_REQUEST] browse_files - Browse project file "
-                "structure and count files\n"
-                "\n"
-                "CRITICAL: 'describe viewport' = describe_viewport, "
-                "NOT capture_blueprint!\n"
-                "\n"
-                "For GENERAL advice (e.g., 'how do I create a C++ file'), "
-                "provide helpful guidance without tokens. ")
-    return base_msg + style_modifier
+    style_modifier = get_style(current_style).prompt_modifier
+
+    system_msg = _SYSTEM_MSG_CACHE.get(style_modifier)
+    if system_msg is None:
+        system_msg = _BASE_SYSTEM_MSG + style_modifier
+        _SYSTEM_MSG_CACHE[style_modifier] = system_msg
+    return system_msg
+
+
+# Per-project locks serializing conversation turns in /execute_command
+_session_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _session_lock(project_id: str) -> asyncio.Lock:
+    """Get the lock guarding a project's session messages."""
+    return _session_locks.setdefault(project_id, asyncio.Lock())
 
 
 def get_project_session_messages(project_id: str, app_config: Dict[str, Any]) -> List[Dict[str, str]]:
     """Get or initialize session messages for a project."""
-    from app.project_registry import get_registry
-    
     registry = get_registry()
     messages = registry.get_session_messages(project_id)
     
@@ -122,6 +208,125 @@ def get_project_session_messages(project_id: str, app_config: Dict[str, Any]) ->
     return messages
 
 
+# Client bundle entries: (file path, archive name, stat of the file)
+_ClientEntry = Tuple[str, str, os.stat_result]
+
+# Names of cache artifacts left out of the client bundle, at any depth
+_CLIENT_SKIP_NAMES = frozenset(
+    ['__pycache__', '.pyc', '.pyo', '.pyd', '__pycache'])
+_CLIENT_SKIP_SUFFIXES = frozenset(['.pyc', '.pyo', '.pyd'])
+
+
+def _scan_client_dir(directory: str, arc_prefix: str,
+                     entries: List[_ClientEntry]) -> None:
+    """
+    Collect the bundle entries below a client directory.
+
+    Uses os.scandir, so file types come from the directory listing and
+    each file costs one stat(); skipped directories are not descended.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name in _CLIENT_SKIP_NAMES:
+                continue
+            arcname = f"{arc_prefix}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                _scan_client_dir(entry.path, arcname, entries)
+            elif (entry.is_file()
+                  and os.path.splitext(entry.name)[1] not in _CLIENT_SKIP_SUFFIXES):
+                entries.append((entry.path, arcname, entry.stat()))
+
+
+def _client_zip_entries() -> List[_ClientEntry]:
+    """List the entries of the UE5 client bundle."""
+    entries: List[_ClientEntry] = []
+
+    # Add all AIAssistant files (fresh read from filesystem)
+    if os.path.isdir("ue5_client/AIAssistant"):
+        _scan_client_dir("ue5_client/AIAssistant", "AIAssistant", entries)
+
+    # Also include init_unreal.py and test_connection.py at root level
+    for extra_file in ["init_unreal.py", "test_connection.py"]:
+        extra_path = f"ue5_client/{extra_file}"
+        with contextlib.suppress(OSError):
+            entries.append((extra_path, extra_file, os.stat(extra_path)))
+
+    return entries
+
+
+# Templates served by the dashboard routes, built at startup
+DASHBOARD_TEMPLATES = ("unified_dashboard.html", "dashboard_project_hub.html")
+
+# Parallel file copies used by /api/deploy_client
+DEPLOY_COPY_WORKERS = 8
+
+# (signature of the client files, path of the zip built from them, path of
+# the build it superseded)
+_client_zip: Tuple[Optional[str], Optional[str], Optional[str]] = (
+    None, None, None)
+_client_zip_lock = threading.Lock()
+
+
+def get_client_zip() -> str:
+    """
+    Return the path of a zip of the UE5 client files.
+
+    The archive is built once and reused until a client file is added,
+    removed or modified, so downloads cost a stat() per file instead of
+    re-compressing the bundle. Each build gets a new file name, and the
+    superseded build is only deleted on the rebuild after, so a response
+    handed its path just before a rebuild can still open it.
+    """
+    global _client_zip
+    entries = _client_zip_entries()
+    signature = hashlib.sha1(repr([
+        (arcname, st.st_mtime_ns, st.st_size)
+        for _, arcname, st in entries
+    ]).encode()).hexdigest()
+
+    with _client_zip_lock:
+        old_signature, old_path, stale_path = _client_zip
+        if signature == old_signature and old_path and os.path.exists(old_path):
+            return old_path
+
+        path = os.path.join(tempfile.gettempdir(),
+                            f"ue5_client_{signature[:16]}.zip")
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path),
+                                         suffix=".tmp", delete=False) as tmp:
+            try:
+                with zipfile.ZipFile(tmp, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                    for file_path, arcname, _ in entries:
+                        zip_file.write(file_path, arcname)
+            except BaseException:
+                tmp.close()
+                with contextlib.suppress(OSError):
+                    os.remove(tmp.name)
+                raise
+        os.replace(tmp.name, path)
+
+        if stale_path and stale_path not in (path, old_path):
+            with contextlib.suppress(OSError):
+                os.remove(stale_path)
+        if old_path == path:
+            old_path = stale_path
+        _client_zip = (signature, path, old_path)
+        return path
+
+
+def _deploy_client_file(source: Path, target: Path, rel_path: Path,
+                        replace_existing: bool) -> None:
+    """Copy one client file into a UE5 project for /api/deploy_client."""
+    # Use atomic replacement for existing files (works even if file is in use)
+    if replace_existing:
+        temp_file = target.with_suffix(target.suffix + '.tmp')
+        shutil.copy2(source, temp_file)
+        temp_file.replace(target)  # Atomic operation
+        print(f"   ✅ Overwrote: {rel_path}")
+    else:
+        shutil.copy2(source, target)
+        print(f"   ✅ Created: {rel_path}")
+
+
 def register_routes(app, app_config: Dict[str, Any], save_config_func):
     """Register all routes with the FastAPI app."""
 
@@ -132,13 +337,12 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         """Redirect to dashboard."""
         return RedirectResponse(url="/dashboard", status_code=307)
 
+    # Handlers doing blocking filesystem work are plain defs, so FastAPI
+    # runs them in its threadpool instead of stalling the event loop
+
     @app.post("/api/deploy_client")
-    async def deploy_client(request: dict):
+    def deploy_client(request: dict):
         """Deploy client files directly to UE5 project path."""
-        import shutil
-        from pathlib import Path
-        import os
-
         project_path = request.get("project_path", "")
         overwrite = request.get("overwrite", True)
 
@@ -169,8 +373,9 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
             # Create target directory
             target_base.mkdir(parents=True, exist_ok=True)
 
-            # Copy files
-            copied_files = []
+            # Plan the copies and create directories serially, so the
+            # parallel copies below never race on mkdir
+            copies = []
             overwrote_count = 0
 
             for file_path in source_base.rglob("*"):
@@ -187,18 +392,14 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
 
                     # Create parent directory
                     target_file.parent.mkdir(parents=True, exist_ok=True)
+                    copies.append((file_path, target_file, rel_path, file_exists))
 
-                    # Use atomic replacement for existing files (works even if file is in use)
-                    if file_exists:
-                        temp_file = target_file.with_suffix(target_file.suffix + '.tmp')
-                        shutil.copy2(file_path, temp_file)
-                        temp_file.replace(target_file)  # Atomic operation
-                        print(f"   ✅ Overwrote: {rel_path}")
-                    else:
-                        shutil.copy2(file_path, target_file)
-                        print(f"   ✅ Created: {rel_path}")
-                    
-                    copied_files.append(str(rel_path))
+            # Copy files; the copies release the GIL, so they overlap
+            if copies:
+                with ThreadPoolExecutor(max_workers=min(
+                        DEPLOY_COPY_WORKERS, len(copies))) as executor:
+                    list(executor.map(lambda copy: _deploy_client_file(*copy), copies))
+            copied_files = [str(rel_path) for _, _, rel_path, _ in copies]
 
             return {
                 "success":
@@ -238,8 +439,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.get("/deploy/modern")
     async def modern_deploy_page():
         """Serve the modern File System Access API deployment page."""
-        from pathlib import Path
-
         template_path = Path("app/templates/file_system_access.html")
         if template_path.exists():
             content = template_path.read_text()
@@ -249,10 +448,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.get("/api/deploy_agent_installer")
     async def get_deploy_agent_installer():
         """Download the Deploy Agent installer batch file."""
-        from pathlib import Path
-
-        from fastapi.responses import Response
-
         installer_path = Path("scripts/deploy_agent_installer.bat")
         if installer_path.exists():
             content = installer_path.read_text()
@@ -268,10 +463,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.post("/api/deploy_agent_bootstrap")
     async def deploy_agent_bootstrap_post():
         """Bootstrap endpoint for Deploy Agent (POST bypasses CDN cache)."""
-        from pathlib import Path
-
-        from fastapi.responses import Response
-
         agent_path = Path("ue5_client/deploy_agent.py")
         if agent_path.exists():
             content = agent_path.read_text()
@@ -288,10 +479,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.get("/api/protocol_handler")
     async def get_protocol_handler():
         """Generate Windows registry file for protocol handler."""
-        from pathlib import Path
-
-        from fastapi.responses import Response
-
         reg_path = Path("scripts/ue5_protocol_handler.reg")
         if reg_path.exists():
             content = reg_path.read_bytes()  # Use read_bytes for .reg files
@@ -307,10 +494,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.get("/api/get_installer_script")
     async def get_installer_script_new():
         """Download batch installer (no admin required)."""
-        from pathlib import Path
-
-        from fastapi.responses import Response
-
         script_path = Path("scripts/install_client.bat")
         if script_path.exists():
             content = script_path.read_text()
@@ -332,10 +515,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.post("/api/installer_script")
     async def get_installer_script_post():
         """POST version to bypass CDN cache completely - with forced fix."""
-        from pathlib import Path
-
-        from fastapi.responses import Response
-
         # Force read the actual file from disk, bypassing any caching
         script_path = Path("scripts/install_ue5_assistant.ps1")
         if script_path.exists():
@@ -363,11 +542,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
 
         Returns embedded PowerShell batch installer.
         """
-        import hashlib
-        from pathlib import Path
-
-        from fastapi.responses import Response
-
         script_path = Path("scripts/install_client.bat")
         if script_path.exists():
             content = script_path.read_text(encoding='utf-8')
@@ -400,10 +574,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.post("/api/installer_script_v2")
     async def get_installer_script_fresh():
         """Fresh endpoint to bypass all caching layers."""
-        from pathlib import Path
-
-        from fastapi.responses import Response
-
         # Read the file directly
         script_path = Path("scripts/install_ue5_assistant.ps1")
         if script_path.exists():
@@ -428,9 +598,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         Return manifest of current client files (bypasses CDN via POST).
         Includes content hash for Deploy Agent to detect updates.
         """
-        import hashlib
-        from pathlib import Path
-
         client_dir = Path("ue5_client/AIAssistant")
 
         # Collect all files and compute content hash
@@ -463,45 +630,12 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         }
 
     @app.post("/api/download_client_bundle")
-    async def download_client_bundle():
+    def download_client_bundle():
         """
         Download client bundle via POST (bypasses CDN cache).
         Deploy Agent should use this instead of GET /api/download_client.
         """
-        import io
-        import time
-        import zipfile
-        from pathlib import Path
-
-        from fastapi.responses import StreamingResponse
-
-        # Create in-memory zip
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w',
-                             zipfile.ZIP_DEFLATED) as zip_file:
-            # Add all AIAssistant files (fresh read from filesystem)
-            client_dir = Path("ue5_client/AIAssistant")
-
-            if client_dir.exists():
-                for file_path in client_dir.rglob("*"):
-                    if file_path.is_file():
-                        # Skip cache files and unwanted artifacts
-                        if any(part in file_path.parts for part in ['__pycache__', '.pyc', '.pyo', '.pyd', '__pycache']):
-                            continue
-                        if file_path.suffix in ['.pyc', '.pyo', '.pyd']:
-                            continue
-                        
-                        arcname = str(file_path.relative_to("ue5_client"))
-                        zip_file.write(file_path, arcname)
-
-            # Also include init_unreal.py and test_connection.py at root level
-            for extra_file in ["init_unreal.py", "test_connection.py"]:
-                extra_path = Path(f"ue5_client/{extra_file}")
-                if extra_path.exists():
-                    zip_file.write(extra_path, extra_file)
-
-        zip_buffer.seek(0)
+        zip_path = get_client_zip()
 
         # POST requests bypass CDN, but add headers anyway
         headers = {
@@ -513,51 +647,18 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
             str(int(time.time()))
         }
 
-        return StreamingResponse(zip_buffer,
-                                 media_type="application/zip",
-                                 headers=headers)
+        return FileResponse(zip_path,
+                            media_type="application/zip",
+                            headers=headers)
 
     @app.get("/api/download_client")
-    async def download_client():
+    def download_client():
         """
         Download client bundle via GET (reliable Replit-compatible endpoint).
         This is the primary download endpoint used by installers.
         Returns ZIP for Windows compatibility (PowerShell Expand-Archive).
         """
-        import io
-        import time
-        import zipfile
-        from pathlib import Path
-
-        from fastapi.responses import StreamingResponse
-
-        # Create in-memory ZIP for Windows native support
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w',
-                             zipfile.ZIP_DEFLATED) as zip_file:
-            # Add all AIAssistant files (fresh read from filesystem)
-            client_dir = Path("ue5_client/AIAssistant")
-
-            if client_dir.exists():
-                for file_path in client_dir.rglob("*"):
-                    if file_path.is_file():
-                        # Skip cache files and unwanted artifacts
-                        if any(part in file_path.parts for part in ['__pycache__', '.pyc', '.pyo', '.pyd', '__pycache']):
-                            continue
-                        if file_path.suffix in ['.pyc', '.pyo', '.pyd']:
-                            continue
-                        
-                        arcname = str(file_path.relative_to("ue5_client"))
-                        zip_file.write(file_path, arcname)
-
-            # Also include init_unreal.py and test_connection.py at root level
-            for extra_file in ["init_unreal.py", "test_connection.py"]:
-                extra_path = Path(f"ue5_client/{extra_file}")
-                if extra_path.exists():
-                    zip_file.write(extra_path, extra_file)
-
-        zip_buffer.seek(0)
+        zip_path = get_client_zip()
 
         # Add cache-busting headers
         headers = {
@@ -573,14 +674,14 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
             str(int(time.time()))
         }
 
-        return StreamingResponse(zip_buffer,
-                                 media_type="application/zip",
-                                 headers=headers)
+        return FileResponse(zip_path,
+                            media_type="application/zip",
+                            headers=headers)
 
     @app.get("/api/download_client_bundle")
-    async def download_client_bundle_get():
+    def download_client_bundle_get():
         """Alias for /api/download_client (backwards compatibility)."""
-        return await download_client()
+        return download_client()
 
     @app.get("/health")
     async def health_check():
@@ -597,8 +698,8 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         return {"status": "ok", "message": "FastAPI test route reachable."}
 
     @app.get("/ping_openai")
-    async def ping_openai():
-        """Verifies OpenAI connectivity."""
+    def ping_openai():
+        """Verifies OpenAI connectivity (sync, so it runs in the threadpool)."""
         model = app_config.get("model", "gpt-4o-mini")
         return test_openai_connection(model)
 
@@ -608,9 +709,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         Handles user prompts from Unreal's AI Command Console.
         Maintains short-term conversation context across turns (per-project).
         """
-        import openai
-        from app.project_registry import get_registry
-
         # Accept both "prompt" (new) and "user_input" (legacy)
         # for backwards compatibility
         user_input = request.get("prompt") or request.get("user_input", "")
@@ -632,16 +730,14 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
             # Tokenized command routing
 
             # Viewport/Scene queries
-            if any(
-                    k in lower for k in
-                ["what do i see", "viewport", "describe viewport", "scene"]):
+            if _VIEWPORT_QUERY_RE.search(lower):
                 return {
                     "success": True,
                     "response": "[UE_REQUEST] describe_viewport"
                 }
 
             # Actor list queries
-            if "list actors" in lower or "list of actors" in lower:
+            if _ACTOR_LIST_QUERY_RE.search(lower):
                 return {
                     "success": True,
                     "response": "[UE_REQUEST] list_actors"
@@ -655,11 +751,7 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
                 }
 
             # Project-specific queries - need AI interpretation
-            if any(k in lower for k in [
-                    "my project", "project name", "project called",
-                    "what am i working on", "current project", "this project",
-                    "project info", "breakdown"
-            ]):
+            if _PROJECT_QUERY_RE.search(lower):
                 # Signal UE5 to collect context and send for AI processing
                 return {
                     "success": True,
@@ -668,11 +760,8 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
                 }
 
             # Blueprint capture requests - need AI interpretation
-            if any(k in lower for k in [
-                    "capture", "screenshot", "screen shot", "show blueprint",
-                    "picture of", "image of"
-            ]) and any(b in lower
-                       for b in ["blueprint", "bp_", "graph", "node"]):
+            if (_CAPTURE_QUERY_RE.search(lower)
+                    and _BLUEPRINT_TERM_RE.search(lower)):
                 return {
                     "success":
                     True,
@@ -681,10 +770,7 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
                 }
 
             # File/Asset browsing
-            if any(k in lower for k in [
-                    "show files", "list files", "browse files", "what files",
-                    "project files"
-            ]):
+            if _FILE_BROWSE_QUERY_RE.search(lower):
                 return {
                     "success": True,
                     "response": "[UE_REQUEST] browse_files"
@@ -697,43 +783,45 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
                     "response": "[UE_REQUEST] list_blueprints"
                 }
 
-            # Get per-project conversation history
-            registry = get_registry()
-            session_messages = get_project_session_messages(project_id, app_config)
-            
-            # Update memory
-            session_messages.append({"role": "user", "content": user_input})
-            max_context_turns = app_config.get("max_context_turns", 6)
-            user_assistant_msgs = [
-                m for m in session_messages if m["role"] != "system"
-            ]
-            if len(user_assistant_msgs) > max_context_turns * 2:
-                session_messages[:] = session_messages[:1] + user_assistant_msgs[
-                    -(max_context_turns * 2):]
-
-            # Send to OpenAI
-            model_name = app_config.get("model", "gpt-4o-mini")
-            response = openai.chat.completions.create(
-                model=model_name,
-                messages=cast(List[Any], session_messages),
-                temperature=app_config.get("temperature", 0.7),
-            )
-
-            reply = (response.choices[0].message.content or "").strip()
-            print(f"[AI Response] {reply}")
-
-            # Handle UE-request tokens
-            if reply.startswith("[UE_REQUEST]"):
-                token = reply.replace("[UE_REQUEST]", "").strip()
-                print(f"[AIConsole] Detected UE token: {token}")
-                return {"success": True, "response": f"[UE_REQUEST] {token}"}
-
-            # Append reply to memory
-            session_messages.append({"role": "assistant", "content": reply})
-            registry.set_session_messages(project_id, session_messages)
-            conversation.add_to_history(user_input, reply, "execute_command")
-
-            return {"success": True, "response": reply}
+            # Get per-project conversation history. A project's turns run
+            # one at a time so concurrent requests cannot interleave or
+            # drop each other's messages while the model call is awaited
+            async with _session_lock(project_id):
+                registry = get_registry()
+                session_messages = get_project_session_messages(project_id, app_config)
+                
+                # Update memory
+                session_messages.append({"role": "user", "content": user_input})
+                max_context_turns = app_config.get("max_context_turns", 6)
+                # Drop the oldest turns in place, keeping the leading system
+                # message; only the overflow is touched, not the whole history
+                first_turn = 1 if session_messages[0]["role"] == "system" else 0
+                excess = len(session_messages) - first_turn - max_context_turns * 2
+                if excess > 0:
+                    del session_messages[first_turn:first_turn + excess]
+
+                # Send to OpenAI
+                model_name = app_config.get("model", "gpt-4o-mini")
+                reply = (await call_openai_chat(
+                    model_name,
+                    session_messages,
+                    app_config.get("temperature", 0.7),
+                    use_cache=caching_enabled(app_config),
+                )).strip()
+                print(f"[AI Response] {reply}")
+
+                # Handle UE-request tokens
+                if reply.startswith("[UE_REQUEST]"):
+                    token = reply.replace("[UE_REQUEST]", "").strip()
+                    print(f"[AIConsole] Detected UE token: {token}")
+                    return {"success": True, "response": f"[UE_REQUEST] {token}"}
+
+                # Append reply to memory
+                session_messages.append({"role": "assistant", "content": reply})
+                registry.set_session_messages(project_id, session_messages)
+                conversation.add_to_history(user_input, reply, "execute_command")
+
+                return {"success": True, "response": reply}
 
         except Exception as e:
             print(f"[ERROR] {e}")
@@ -748,10 +836,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         Answer user question using collected context data and AI.
         This allows natural language responses instead of canned summaries.
         """
-        import json
-
-        import openai
-
         user_question = request.get("question", "")
         context_data = request.get("context", {})
         context_type = request.get("context_type", "unknown")
@@ -761,7 +845,7 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
 
         try:
             # Build context-aware prompt
-            context_str = json.dumps(context_data, indent=2)
+            context_str = to_prompt_json(context_data)
 
             prompt = (
                 f"User question: {user_question}\n\n"
@@ -772,19 +856,18 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
 
             # Get AI response
             model_name = app_config.get("model", "gpt-4o-mini")
-            response = openai.chat.completions.create(
-                model=model_name,
-                messages=[{
+            reply = (await call_openai_chat(
+                model_name,
+                [{
                     "role": "system",
                     "content": get_system_message(app_config)
                 }, {
                     "role": "user",
                     "content": prompt
                 }],
-                temperature=app_config.get("temperature", 0.7),
-            )
-
-            reply = (response.choices[0].message.content or "").strip()
+                app_config.get("temperature", 0.7),
+                use_cache=caching_enabled(app_config),
+            )).strip()
 
             # Log to conversation history
             conversation.add_to_history(user_question, reply,
@@ -802,17 +885,15 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         """
         Takes a factual string from UE and converts it to structured technical prose.
         """
-        import openai
-
         summary_text = request.get("summary", "")
         if not summary_text:
             return {"error": "No summary text provided."}
 
         try:
             model_name = app_config.get("model", "gpt-4o-mini")
-            response = openai.chat.completions.create(
-                model=model_name,
-                messages=[
+            wrapped = await call_openai_chat(
+                model_name,
+                [
                     {
                         "role":
                         "system",
@@ -830,10 +911,9 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
                         "content": summary_text
                     },
                 ],
-                temperature=app_config.get("temperature", 0.7),
+                app_config.get("temperature", 0.7),
+                use_cache=caching_enabled(app_config),
             )
-
-            wrapped = response.choices[0].message.content or ""
             conversation.add_to_history(summary_text, wrapped,
                                         "wrap_natural_language")
             return {"response": wrapped.strip()}
@@ -847,31 +927,31 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         """
         Intelligently describes viewport using style-aware data filtering and prompting.
         """
-        # Parse incoming JSON
+        # Parse and validate the raw body in one pass; unusable fields fall
+        # back to an empty ViewportContext, only malformed JSON is an error
         try:
-            raw_data: dict[str, Any] = await request.json()
+            context = ViewportContext.model_validate_json(await request.body())
+        except ValidationError as e:
+            if e.errors()[0]["type"] != "json_invalid":
+                context = ViewportContext()
+            else:
+                print(f"[Error] Failed to parse JSON: {e}")
+                return {
+                    "response": f"Error reading viewport data: {e}",
+                    "raw_context": {}
+                }
         except Exception as e:
-            print(f"[Error] Failed to parse JSON: {e}")
+            print(f"[Error] Failed to read request body: {e}")
             return {
                 "response": f"Error reading viewport data: {e}",
                 "raw_context": {}
             }
 
-        # Coerce into ViewportContext
-        try:
-            context = ViewportContext(**raw_data)
-        except Exception:
-            try:
-                context = ViewportContext.model_validate(raw_data)
-            except Exception:
-                context = ViewportContext()
-
         # Get configured response style and apply intelligent filtering
         current_style = app_config.get("response_style", "descriptive")
-        style_config = RESPONSE_STYLES.get(current_style,
-                                           RESPONSE_STYLES["descriptive"])
+        style = get_style(current_style)
 
-        filter_mode = style_config["data_filter"]
+        filter_mode = style.data_filter
         filtered_data = filter_viewport_data(context, filter_mode)
 
         print(
@@ -884,8 +964,7 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         temperature = app_config.get("temperature", 0.7)
 
         summary = generate_viewport_description(filtered_data, current_style,
-                                                style_config, model,
-                                                temperature)
+                                                style, model, temperature)
 
         # Fallback logic if AI fails
         if not summary or len(summary.split()) < 4:
@@ -922,14 +1001,43 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.get("/api/conversations")
     async def get_conversations(limit: int = 50):
         """Get recent conversation history for dashboard."""
-        history = conversation.get_history(limit)
-        recent = list(reversed(history))
         return {
-            "conversations": recent,
+            "conversations": conversation.get_history(limit, newest_first=True),
             "total": len(conversation.conversation_history),
             "max_size": conversation.MAX_HISTORY_SIZE
         }
 
+    @app.get("/api/conversations/stream")
+    async def stream_conversations():
+        """
+        Push new conversations to the dashboard as server-sent events.
+
+        Each new entry is sent as a default "message" event; clearing the
+        history sends a "clear" event. A comment line every 15 seconds
+        keeps idle proxies from closing the connection.
+        """
+        async def events():
+            # Subscribe only once streaming starts, so a client that
+            # disconnects before the first chunk never leaves a queue behind
+            queue = conversation.subscribe()
+            try:
+                while True:
+                    try:
+                        kind, entry = await asyncio.wait_for(queue.get(), 15)
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"
+                        continue
+                    if kind == "clear":
+                        yield "event: clear\ndata: {}\n\n"
+                    else:
+                        yield f"data: {json.dumps(entry, ensure_ascii=False)}\n\n"
+            finally:
+                conversation.unsubscribe(queue)
+
+        return StreamingResponse(events(),
+                                 media_type="text/event-stream",
+                                 headers={"Cache-Control": "no-cache"})
+
     @app.get("/api/config")
     async def get_config():
         """Get current configuration."""
@@ -956,7 +1064,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
 
         # Update system message for all projects if response_style changed
         if "response_style" in update_dict:
-            from app.project_registry import get_registry
             registry = get_registry()
             new_system_msg = get_system_message(app_config)
             
@@ -1004,7 +1111,7 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     file_service = FileSystemService(max_depth=10)
 
     @app.post("/api/files/list")
-    async def list_files(request: dict):
+    def list_files(request: dict):
         """List files in a directory."""
         directory_path = request.get("path", ".")
         recursive = request.get("recursive", False)
@@ -1018,7 +1125,7 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
             return {"success": False, "error": str(e), "type": "general"}
 
     @app.post("/api/files/read")
-    async def read_file(request: dict):
+    def read_file(request: dict):
         """Read a file's content."""
         file_path = request.get("path")
 
@@ -1034,7 +1141,7 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
             return {"success": False, "error": str(e), "type": "general"}
 
     @app.post("/api/files/search")
-    async def search_files(request: dict):
+    def search_files(request: dict):
         """Search for files matching criteria."""
         root_path = request.get("root_path", ".")
         pattern = request.get("pattern")
@@ -1222,10 +1329,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         Returns:
             Registration result with success status
         """
-        import hashlib
-        from datetime import datetime
-        
-        from app.project_registry import get_registry
         
         try:
             # Log registration attempt
@@ -1284,7 +1387,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
             
         except Exception as e:
             print(f"❌ Unified registration failed: {e}")
-            import traceback
             traceback.print_exc()
             return {
                 "success": False,
@@ -1299,10 +1401,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         Args:
             project_id: Project to update
         """
-        from datetime import datetime
-        
-        from app.project_registry import get_registry
-        
         try:
             registry = get_registry()
             
@@ -1324,10 +1422,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.post("/api/register_project")
     async def register_project(request: dict):
         """Register a UE5 project from the client or browser."""
-        import hashlib
-
-        from app.project_registry import get_registry
-
         # Support both formats: direct fields or nested project_data
         if "project_data" in request:
             # Format from UE5 client
@@ -1370,8 +1464,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.delete("/api/project/{project_id}")
     async def delete_project(project_id: str):
         """Delete a project from the registry."""
-        from app.project_registry import get_registry
-
         registry = get_registry()
         result = registry.delete_project(project_id)
         return result
@@ -1387,10 +1479,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         - Marks projects inactive if no activity for 60 seconds
         - Single source of truth (no duplicate HTTP client merging needed)
         """
-        from datetime import datetime, timedelta
-        
-        from app.project_registry import get_registry
-
         registry = get_registry()
         
         # Get all projects from registry
@@ -1439,7 +1527,8 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
                     'last_seen': None
                 }
         
-        return {"success": True, "projects": projects}
+        # Registry data is plain JSON already; skip jsonable_encoder
+        return JSON_RESPONSE_CLASS({"success": True, "projects": projects})
 
     @app.get("/api/projects_federated")
     async def list_projects_federated():
@@ -1449,11 +1538,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         This allows development dashboard to see production connections in real-time.
         Security: Uses hardcoded production server URL to prevent SSRF.
         """
-        import httpx
-        from datetime import datetime, timedelta
-        
-        from app.project_registry import get_registry
-
         # SECURITY: Hardcoded production server URL (no user input)
         PRODUCTION_SERVER = "https://ue5-assistant-noahbutcher97.replit.app"
 
@@ -1530,7 +1614,7 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
                     # If both exist, add server info to show it's on both
                     all_projects[proj_id]['on_multiple_servers'] = True
         
-        return {
+        return JSON_RESPONSE_CLASS({
             "success": True,
             "projects": list(all_projects.values()),
             "sources": {
@@ -1538,13 +1622,11 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
                 "remote": len(remote_projects),
                 "remote_server": PRODUCTION_SERVER
             }
-        }
+        })
 
     @app.get("/api/active_project")
     async def get_active_project():
         """Get the currently active project."""
-        from app.project_registry import get_registry
-
         registry = get_registry()
         project = registry.get_active_project()
 
@@ -1556,8 +1638,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.post("/api/set_active_project")
     async def set_active_project(request: dict):
         """Set the active project."""
-        from app.project_registry import get_registry
-
         project_id = request.get("project_id", "")
 
         if not project_id:
@@ -1569,8 +1649,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.post("/api/set_connection_mode")
     async def set_connection_mode(request: dict):
         """Set connection mode preference for a project."""
-        from app.project_registry import get_registry
-
         project_id = request.get("project_id", "")
         connection_mode = request.get("connection_mode", "http")
 
@@ -1588,29 +1666,37 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
     @app.delete("/api/projects")
     async def clear_all_projects():
         """Clear all projects from the registry."""
-        from app.project_registry import get_registry
-
         registry = get_registry()
         result = registry.clear_all_projects()
         return result
 
+    @app.on_event("startup")
+    async def warm_dashboard_pages():
+        """Build the dashboard pages before the first request needs them."""
+        for name in DASHBOARD_TEMPLATES:
+            await prepare_page(name)
+
     @app.get("/dashboard", response_class=HTMLResponse)
-    async def dashboard():
+    async def dashboard(request: Request):
         """Serve the unified dashboard with Project Hub."""
-        from pathlib import Path
-
-        dashboard_path = Path(
-            __file__).parent / "templates" / "unified_dashboard.html"
-        return HTMLResponse(content=dashboard_path.read_text())
+        await prepare_page("unified_dashboard.html")
+        return template_response("unified_dashboard.html", request)
 
     @app.get("/dashboard/project-hub", response_class=HTMLResponse)
-    async def project_hub():
+    async def project_hub(request: Request):
         """Serve the Project Hub HTML page."""
-        from pathlib import Path
-
-        hub_path = Path(
-            __file__).parent / "templates" / "dashboard_project_hub.html"
-        return HTMLResponse(content=hub_path.read_text())
+        await prepare_page("dashboard_project_hub.html")
+        return template_response("dashboard_project_hub.html", request)
+
+    @app.get("/static/{filename}")
+    async def static_asset(filename: str, request: Request):
+        """Serve a script extracted from a dashboard template."""
+        await prepare_asset(filename)
+        response = asset_response(filename, request)
+        if response is None:
+            raise HTTPException(status_code=404,
+                                detail=f"Asset not found: {filename}")
+        return response
 
     @app.post("/api/project_query")
     async def project_query(request: dict):
@@ -1618,10 +1704,6 @@ def register_routes(app, app_config: Dict[str, Any], save_config_func):
         Handle project intelligence queries from browser.
         Uses active project context and can trigger UE5 data collection.
         """
-        import openai
-
-        from app.project_registry import get_registry
-
         query = request.get("query", "")
 
         if not query:
@@ -1686,7 +1768,6 @@ When users ask about their project's actual data "
                 action = ai_response.replace("[UE_REQUEST]", "").strip()
 
                 # Try to execute in connected UE5 client
-                from app.websocket_manager import get_manager
                 manager = get_manager()
 
                 # Check if UE5 client is connected for this project
@@ -1799,8 +1880,6 @@ When users ask about their project's actual data "
     @app.websocket("/ws/ue5/{project_id}")
     async def websocket_ue5_endpoint(websocket: WebSocket, project_id: str):
         """WebSocket endpoint for UE5 client connections."""
-        from app.websocket_manager import get_manager
-
         print(f"🔌 WebSocket connection attempt from UE5: {project_id}")
         print(f"   Headers: {websocket.headers}")
         print(f"   Client: {websocket.client}")
@@ -1822,8 +1901,6 @@ When users ask about their project's actual data "
     @app.websocket("/ws/dashboard")
     async def websocket_dashboard_endpoint(websocket: WebSocket):
         """WebSocket endpoint for dashboard connections."""
-        from app.websocket_manager import get_manager
-
         manager = get_manager()
         await manager.connect_dashboard(websocket)
 
@@ -1870,8 +1947,6 @@ When users ask about their project's actual data "
     @app.post("/send_command_to_ue5")
     async def send_command_to_ue5_endpoint(request: dict):
         """Send a command from dashboard to UE5 and return the response."""
-        from app.websocket_manager import get_manager
-
         project_id = request.get("project_id")
         command = request.get("command")
 
@@ -1890,10 +1965,6 @@ When users ask about their project's actual data "
 
         Called on backend republish.
         """
-        import time
-
-        from app.websocket_manager import get_manager
-
         print("📢 Broadcasting auto-update to all UE5 clients...")
 
         try:
@@ -1948,12 +2019,6 @@ When users ask about their project's actual data "
         Generate and deploy UE 5.6 compliant editor utility widget.
         Fully automated - no copy/pasting required.
         """
-        import os
-        from pathlib import Path
-        from datetime import datetime
-        from app.project_registry import get_registry
-        from app.websocket_manager import get_manager
-
         name = request.get("name", "CustomTool")
         description = request.get("description", "")
         capabilities = request.get("capabilities", [])
@@ -1976,7 +2041,6 @@ When users ask about their project's actual data "
             class_name = sanitize_class_name(name)
             
             # Use AI to generate the widget script
-            import openai
             
             model_name = app_config.get("model", "gpt-4o-mini")
             
@@ -2078,7 +2142,6 @@ Return ONLY the complete Python script, no explanations or markdown."""
                 ]
             }
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             print(f"❌ Widget generation error: {error_details}")
             return {
@@ -2089,11 +2152,6 @@ Return ONLY the complete Python script, no explanations or markdown."""
     @app.post("/api/file_drop")
     async def file_drop(request: dict):
         """Send file content to UE5 client for local writing - File Drop tool."""
-        from datetime import datetime
-        
-        from app.project_registry import get_registry
-        from app.websocket_manager import get_manager
-        
         filename = request.get("filename", "test_file.txt")
         content = request.get("content", "")
         
@@ -2148,7 +2206,6 @@ Return ONLY the complete Python script, no explanations or markdown."""
                 }
                 
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             print(f"❌ File Drop error: {error_details}")
             return {
@@ -2159,9 +2216,6 @@ Return ONLY the complete Python script, no explanations or markdown."""
     @app.post("/api/reconnect_client")
     async def reconnect_client(request: dict):
         """Send reconnect command to UE5 client to restart HTTP polling."""
-        from datetime import datetime
-        from app.websocket_manager import get_manager
-        
         project_id = request.get("project_id")
         
         if not project_id:
@@ -2234,10 +2288,6 @@ Return ONLY the complete Python script, no explanations or markdown."""
     @app.post("/api/generate_action_plan")
     async def generate_action_plan(request: dict):
         """Generate AI action plan for scene building."""
-        import json
-
-        import openai
-
         description = request.get("description", "")
 
         if not description:
@@ -2311,10 +2361,6 @@ Return ONLY the JSON array, no explanation.""")
         - Dashboard shows accurate connection status
         - Single source of truth for all projects
         """
-        from datetime import datetime
-
-        from app.websocket_manager import get_manager
-
         project_id = request.get("project_id")
         project_name = request.get("project_name", "Unknown")
         project_path = request.get("project_path", "")  # Optional path metadata
@@ -2388,10 +2434,6 @@ Return ONLY the JSON array, no explanation.""")
         - Updating last_seen timestamp in Project Registry
         - Keeping both in-memory and persistent registrations in sync
         """
-        from datetime import datetime
-
-        from app.websocket_manager import get_manager
-
         project_id = request.get("project_id")
         project_name = request.get("project_name", "Unknown")
         project_path = request.get("project_path", "")
@@ -2417,7 +2459,6 @@ Return ONLY the JSON array, no explanation.""")
         # Auto-register if not in HTTP clients dict (server restart recovery)
         if project_id not in manager.http_clients:
             # Check if project already exists in registry (preserve existing path)
-            from app.project_registry import get_registry
             registry = get_registry()
             existing_project = registry.projects.get(project_id)
             
@@ -2477,10 +2518,6 @@ Return ONLY the JSON array, no explanation.""")
     @app.post("/api/ue5/heartbeat")
     async def ue5_heartbeat(request: dict):
         """Keep-alive heartbeat from UE5 HTTP client."""
-        from datetime import datetime
-
-        from app.websocket_manager import get_manager
-
         project_id = request.get("project_id")
         if not project_id:
             return {"success": False}
@@ -2501,8 +2538,6 @@ Return ONLY the JSON array, no explanation.""")
     @app.post("/api/ue5/response")
     async def ue5_response(request: dict):
         """Receive action response from UE5 HTTP client."""
-        from app.websocket_manager import get_manager
-
         project_id = request.get("project_id")
         response_data = request.get("response", {})
 
@@ -2533,11 +2568,6 @@ Return ONLY the JSON array, no explanation.""")
         Trigger emergency update (safe mode with no restart).
         This is for fixing thread safety crashes without triggering UE5 restart.
         """
-        import time
-        from datetime import datetime
-
-        from app.websocket_manager import get_manager
-
         try:
             # Make JSON body optional - handle both empty requests and JSON requests
             mode = "no_restart"  # Default mode
@@ -2628,7 +2658,6 @@ Return ONLY the JSON array, no explanation.""")
             }
         except Exception as e:
             print(f"❌ Emergency update trigger failed: {e}")
-            import traceback
             traceback.print_exc()
             return {"status": "error", "error": str(e)}
 
@@ -2718,9 +2747,6 @@ except Exception as e:
         Trigger automatic recovery for all connected HTTP polling clients.
         Queues a recovery command that survives broken polling threads.
         """
-        from datetime import datetime
-        from app.websocket_manager import get_manager
-        
         manager = get_manager()
         recovered_count = 0
         
@@ -2751,9 +2777,6 @@ except Exception as e:
         Switch the backend server endpoint for a specific UE5 client.
         This syncs with the editor-side server configuration.
         """
-        from datetime import datetime
-        from app.websocket_manager import get_manager
-        
         project_id = request.get("project_id")
         server_type = request.get("server_type", "production")
         
@@ -2810,8 +2833,6 @@ except Exception as e:
         Get recent operations/commands executed by UE5 clients.
         Returns operations from WebSocket manager persistent history.
         """
-        from app.websocket_manager import get_manager
-        
         manager = get_manager()
         operations = []
         
@@ -2846,10 +2867,6 @@ except Exception as e:
         Get system events, errors, and diagnostic information.
         Returns events from WebSocket manager persistent history.
         """
-        from datetime import datetime
-        from app.websocket_manager import get_manager
-        from app.services import conversation
-        
         manager = get_manager()
         events = []
         
@@ -1,8 +1,9 @@
 """Conversation history storage with file-based persistence."""
+import asyncio
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 CONVERSATIONS_FILE = Path("app/data/conversations.jsonl")
 MAX_HISTORY_SIZE = 100
@@ -10,6 +11,46 @@ MAX_HISTORY_SIZE = 100
 # In-memory conversation ring buffer
 conversation_history: List[Dict[str, Any]] = []
 
+# Events buffered per live subscriber before new ones are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# (event loop, queue) for every open /api/conversations/stream
+_subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+
+
+def subscribe() -> asyncio.Queue:
+    """
+    Register for live history events on the running event loop.
+
+    The queue receives ("entry", entry) for every new conversation and
+    ("clear", None) when the history is cleared.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    _subscribers.append((asyncio.get_running_loop(), queue))
+    return queue
+
+
+def unsubscribe(queue: asyncio.Queue) -> None:
+    """Stop delivering events to a queue returned by subscribe()."""
+    _subscribers[:] = [sub for sub in _subscribers if sub[1] is not queue]
+
+
+def _offer(queue: asyncio.Queue, event: Tuple[str, Any]) -> None:
+    """Queue an event, dropping it if the subscriber has fallen behind."""
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        pass
+
+
+def _publish(event: Tuple[str, Any]) -> None:
+    """Hand an event to every subscriber, from any thread."""
+    for loop, queue in _subscribers:
+        try:
+            loop.call_soon_threadsafe(_offer, queue, event)
+        except RuntimeError:
+            pass  # Loop already closed; unsubscribe() will follow
+
 
 def load_conversations() -> None:
     """Load conversation history from file on startup."""
@@ -46,6 +87,7 @@ def add_to_history(
     # Keep only last MAX_HISTORY_SIZE entries in memory
     if len(conversation_history) > MAX_HISTORY_SIZE:
         conversation_history.pop(0)
+    _publish(("entry", entry))
     
     # Append to file (persist forever)
     try:
@@ -55,8 +97,18 @@ def add_to_history(
         print(f"[Error] Failed to persist conversation: {e}")
 
 
-def get_history(limit: Optional[int] = None) -> List[Dict[str, Any]]:
-    """Get conversation history."""
+def get_history(limit: Optional[int] = None,
+                newest_first: bool = False) -> List[Dict[str, Any]]:
+    """
+    Get conversation history.
+
+    With newest_first, the same entries are returned in reverse order,
+    taken as one reversed slice rather than a slice plus a reversed copy.
+    """
+    if newest_first:
+        if not limit:
+            return conversation_history[::-1]
+        return conversation_history[:-limit - 1:-1]
     if limit is None:
         return conversation_history
     return conversation_history[-limit:]
@@ -66,6 +118,7 @@ def clear_history() -> None:
     """Clear all conversation history."""
     global conversation_history
     conversation_history = []
+    _publish(("clear", None))
     
     # Clear the file
     if CONVERSATIONS_FILE.exists():
@@ -1,5 +1,6 @@
 """File system service for secure file operations."""
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -43,7 +44,8 @@ class FileSystemService:
             path=str(path),
             name=path.name,
             type="directory" if path.is_dir() else "file",
-            extension=path.suffix if path.is_file() else None,
+            # A listing repeats a few suffixes; share one string for each
+            extension=sys.intern(path.suffix) if path.is_file() else None,
             size=stat.st_size if path.is_file() else None,
             modified=datetime.fromtimestamp(stat.st_mtime).isoformat()
         )
@@ -123,7 +123,8 @@ Based on this context, provide detailed implementation guidance. Include:
         
         has_images = (
             request.blueprint_captures is not None and 
-            any(bp.image_base64 for bp in request.blueprint_captures)
+            any(bp.image_url or bp.image_base64
+                for bp in request.blueprint_captures)
         )
         
         if has_images and request.blueprint_captures:
@@ -132,9 +133,12 @@ Based on this context, provide detailed implementation guidance. Include:
             ]
             
             for bp in request.blueprint_captures:
-                if bp.image_base64:
+                # A hosted image is passed by reference; only captures
+                # without one are inlined as a data URL
+                if bp.image_url or bp.image_base64:
                     image_data_url = (
-                        f"data:image/png;base64,{bp.image_base64}"
+                        bp.image_url
+                        or f"data:image/png;base64,{bp.image_base64}"
                     )
                     user_content.append({
                         "type": "image_url",
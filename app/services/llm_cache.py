@@ -0,0 +1,79 @@
+"""In-process cache of OpenAI chat completion replies."""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+MAX_ENTRIES = 1024
+TTL_SECONDS = 3600
+
+
+def cache_key(model: str, messages: List[Dict[str, Any]],
+              temperature: float) -> str:
+    """Hash everything that determines a completion into a cache key."""
+    payload = json.dumps([model, messages, temperature], sort_keys=True,
+                         separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def caching_enabled(config: Dict[str, Any]) -> bool:
+    """
+    Check whether replies may be served from the cache.
+
+    Replies at temperature 0 are deterministic enough to reuse. Above that
+    the user has to opt in with "cache_responses", since a cached reply
+    never varies.
+    """
+    return (config.get("temperature", 0.7) == 0
+            or bool(config.get("cache_responses", False)))
+
+
+class LLMCache:
+    """Thread-safe LRU cache of completion replies with a time-to-live."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES,
+                 ttl: float = TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (expiry as time.monotonic(), reply), oldest first
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached reply for a key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, reply: str) -> None:
+        """Store a reply, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, reply)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached reply."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global cache shared by all routes
+_cache = LLMCache()
+
+
+def get_cache() -> LLMCache:
+    """Get the global reply cache."""
+    return _cache
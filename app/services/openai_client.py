@@ -1,18 +1,55 @@
 """OpenAI API integration for viewport description generation."""
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, cast
 
 import openai
 
+from app.config import ResponseStyle
+from app.services.llm_cache import cache_key, get_cache
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore  # Optional dependency
+    HAS_ORJSON = False
+
 # Initialize OpenAI API
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
+# Shared async client, created on first use since construction fails
+# without an API key
+_async_client: Optional[openai.AsyncOpenAI] = None
+
+
+def get_async_client() -> openai.AsyncOpenAI:
+    """Get the shared AsyncOpenAI client, reusing its connection pool."""
+    global _async_client
+    if _async_client is None:
+        _async_client = openai.AsyncOpenAI(api_key=openai.api_key)
+    return _async_client
+
+
+def to_prompt_json(data: Any) -> str:
+    """
+    Pretty-print data as JSON for inclusion in a prompt.
+
+    Uses orjson when available. Non-ASCII text is kept as-is rather than
+    escaped, which also spends fewer tokens.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits or non-str keys
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 
 def generate_viewport_description(
     filtered_data: Dict[str, Any],
     style_name: str,
-    style_config: Dict[str, Any],
+    style: ResponseStyle,
     model: str,
     temperature: float
 ) -> str:
@@ -22,7 +59,7 @@ def generate_viewport_description(
     Args:
         filtered_data: Pre-filtered viewport data
         style_name: Name of the response style
-        style_config: Configuration for the style
+        style: Configuration for the style
         model: OpenAI model name
         temperature: Temperature for generation
         
@@ -30,12 +67,14 @@ def generate_viewport_description(
         Generated description or empty string on error
     """
     # Extract style parameters
-    focus = style_config["focus"]
-    style_modifier = style_config["prompt_modifier"]
-    max_tokens = style_config["max_tokens"]
+    focus = style.focus
+    style_modifier = style.prompt_modifier
+    max_tokens = style.max_tokens
     
     # Use temperature override if specified
-    effective_temp = style_config.get("temperature_override", temperature)
+    effective_temp = (style.temperature_override
+                      if style.temperature_override is not None
+                      else temperature)
     
     # Focus instructions for different styles
     focus_instructions = {
@@ -77,7 +116,7 @@ def generate_viewport_description(
     # Build prompt
     prompt = (
         f"Viewport data (filtered for {style_name} style):\n"
-        f"{json.dumps(filtered_data, indent=2)}\n\n"
+        f"{to_prompt_json(filtered_data)}\n\n"
         f"Instructions: {focus_instruction}"
     )
     
@@ -113,6 +152,45 @@ def generate_viewport_description(
         return ""
 
 
+async def call_openai_chat(
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: float,
+    use_cache: bool = False
+) -> str:
+    """
+    Run a chat completion and return the reply text.
+
+    The request is awaited on the async client, so the event loop keeps
+    serving other requests while the model responds.
+
+    Args:
+        model: OpenAI model name
+        messages: Chat messages to send
+        temperature: Temperature for generation
+        use_cache: Reuse an identical earlier request's reply if cached
+
+    Returns:
+        The reply content, or an empty string if the model returned none
+    """
+    key = cache_key(model, messages, temperature) if use_cache else None
+    if key:
+        cached = get_cache().get(key)
+        if cached is not None:
+            return cached
+
+    response = await get_async_client().chat.completions.create(
+        model=model,
+        messages=cast(List[Any], messages),
+        temperature=temperature,
+    )
+    reply = response.choices[0].message.content or ""
+
+    if key:
+        get_cache().set(key, reply)
+    return reply
+
+
 def test_openai_connection(model: str) -> Dict[str, Any]:
     """Test OpenAI API connectivity."""
     try:
@@ -10,7 +10,7 @@ import openai
 from fastapi import FastAPI
 
 from app.config import load_config, save_config
-from app.routes import register_routes
+from app.routes import JSON_RESPONSE_CLASS, register_routes
 from app.services import conversation
 
 # Initialize configuration
@@ -26,6 +26,7 @@ app = FastAPI(
                  "a natural-language description. "
                  "Part of the UE5 AI Assistant Integration by Noah Butcher."),
     version="3.0",
+    default_response_class=JSON_RESPONSE_CLASS,
 )
 
 # Load conversation history from file
@@ -0,0 +1,83 @@
+"""
+Tests for the cached UE5 client download bundle.
+"""
+import os
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import app.routes as routes
+
+
+@pytest.fixture
+def client_dir(tmp_path, monkeypatch):
+    """Run from a directory with a minimal ue5_client tree."""
+    package = tmp_path / "ue5_client" / "AIAssistant"
+    (package / "__pycache__").mkdir(parents=True)
+    (package / "main.py").write_text("print('hi')")
+    (package / "__pycache__" / "main.cpython-311.pyc").write_bytes(b"\0")
+    (tmp_path / "ue5_client" / "init_unreal.py").write_text("import AIAssistant")
+    (tmp_path / "zips").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "zips"))
+    monkeypatch.setattr(routes, "_client_zip", (None, None, None))
+    return package
+
+
+class TestClientZip:
+    """Test get_client_zip()."""
+
+    def test_bundle_contents(self, client_dir):
+        """Test client files are zipped without cache artifacts."""
+        with zipfile.ZipFile(routes.get_client_zip()) as bundle:
+            assert sorted(bundle.namelist()) == [
+                "AIAssistant/main.py", "init_unreal.py"]
+
+    def test_unchanged_files_reuse_the_zip(self, client_dir):
+        """Test repeated downloads do not rebuild the archive."""
+        path = routes.get_client_zip()
+        mtime = os.stat(path).st_mtime_ns
+
+        assert routes.get_client_zip() == path
+        assert os.stat(path).st_mtime_ns == mtime
+
+    def test_edited_file_rebuilds_the_zip(self, client_dir):
+        """Test a changed client file produces a fresh archive."""
+        old = routes.get_client_zip()
+        (client_dir / "main.py").write_text("print('hello, longer')")
+
+        new = routes.get_client_zip()
+
+        assert new != old
+        with zipfile.ZipFile(new) as bundle:
+            assert bundle.read("AIAssistant/main.py") == b"print('hello, longer')"
+
+    def test_superseded_zip_outlives_one_rebuild(self, client_dir):
+        """Test a path handed out before a rebuild stays readable until the next."""
+        first = routes.get_client_zip()
+        (client_dir / "main.py").write_text("print('second version')")
+        routes.get_client_zip()
+
+        assert os.path.exists(first)
+
+        (client_dir / "main.py").write_text("print('third version here')")
+        routes.get_client_zip()
+
+        assert not os.path.exists(first)
+
+    def test_failed_build_leaves_no_temp_file(self, client_dir, tmp_path,
+                                              monkeypatch):
+        """Test a build that raises removes its partial archive."""
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr(zipfile.ZipFile, "write", fail)
+
+        with pytest.raises(OSError):
+            routes.get_client_zip()
+
+        assert list((tmp_path / "zips").iterdir()) == []
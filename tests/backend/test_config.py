@@ -0,0 +1,144 @@
+"""
+Tests for backend configuration loading and saving.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import app.config as config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Point CONFIG_FILE at a temporary file and start with a cold cache."""
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(config, "CONFIG_FILE", str(path))
+    config.invalidate_config_cache()
+    yield path
+    config.invalidate_config_cache()
+
+
+class TestLoadConfig:
+    """Test load_config()."""
+
+    def test_missing_file_returns_defaults(self, config_file):
+        """Test defaults are returned when no file exists."""
+        assert config.load_config() == config.DEFAULT_CONFIG
+
+    def test_file_values_override_defaults(self, config_file):
+        """Test saved values are merged over the defaults."""
+        config_file.write_text('{"model": "gpt-4o"}')
+
+        loaded = config.load_config()
+
+        assert loaded["model"] == "gpt-4o"
+        assert loaded["timeout"] == config.DEFAULT_CONFIG["timeout"]
+
+    def test_unknown_keys_are_dropped(self, config_file):
+        """Test keys outside the config schema are not loaded."""
+        config_file.write_text('{"model": "gpt-4o", "extra": 1}')
+        assert "extra" not in config.load_config()
+
+    def test_invalid_values_fall_back_per_key(self, config_file):
+        """Test a wrongly typed value only resets that key."""
+        config_file.write_text('{"model": "gpt-4o", "timeout": "soon", "verbose": null}')
+
+        loaded = config.load_config()
+
+        assert loaded["model"] == "gpt-4o"
+        assert loaded["timeout"] == config.DEFAULT_CONFIG["timeout"]
+        assert loaded["verbose"] == config.DEFAULT_CONFIG["verbose"]
+
+    def test_invalid_json_returns_defaults(self, config_file):
+        """Test a corrupt file falls back to defaults."""
+        config_file.write_text("{not json")
+        assert config.load_config() == config.DEFAULT_CONFIG
+
+    def test_invalid_json_is_logged(self, config_file, caplog):
+        """Test load errors are reported through the module logger."""
+        config_file.write_text("{not json")
+
+        with caplog.at_level("WARNING", logger=config.__name__):
+            config.load_config()
+
+        assert "Error loading config" in caplog.text
+
+    def test_non_object_json_returns_defaults(self, config_file):
+        """Test a file whose top level is not an object falls back to defaults."""
+        config_file.write_text("[1, 2, 3]")
+        assert config.load_config() == config.DEFAULT_CONFIG
+
+    def test_returned_dict_is_independent(self, config_file):
+        """Test mutating a loaded config does not leak into later loads."""
+        config_file.write_text('{"model": "gpt-4o"}')
+
+        first = config.load_config()
+        first["model"] = "changed"
+
+        assert config.load_config()["model"] == "gpt-4o"
+
+    def test_file_change_is_picked_up(self, config_file):
+        """Test the cache is refreshed when the file changes on disk."""
+        config_file.write_text('{"model": "gpt-4o"}')
+        assert config.load_config()["model"] == "gpt-4o"
+
+        config_file.write_text('{"model": "gpt-4.1-mini"}')
+        assert config.load_config()["model"] == "gpt-4.1-mini"
+
+
+class TestSaveConfig:
+    """Test save_config()."""
+
+    def test_round_trip(self, config_file):
+        """Test a saved config loads back unchanged."""
+        data = {**config.DEFAULT_CONFIG, "response_style": "concise"}
+
+        config.save_config(data)
+
+        assert config.load_config() == data
+
+    def test_save_leaves_no_temp_files(self, config_file):
+        """Test the atomic write cleans up after itself."""
+        config.save_config({"model": "gpt-4o"})
+
+        assert [p.name for p in config_file.parent.iterdir()] == ["config.json"]
+
+    def test_save_refreshes_cached_config(self, config_file):
+        """Test load_config sees values written by save_config."""
+        config.save_config({"model": "gpt-4o"})
+        assert config.load_config()["model"] == "gpt-4o"
+
+        config.save_config({"model": "gpt-4o-mini"})
+        assert config.load_config()["model"] == "gpt-4o-mini"
+
+    def test_output_is_compact_unless_verbose(self, config_file):
+        """Test the file is only pretty-printed when verbose is enabled."""
+        config.save_config({"model": "gpt-4o", "verbose": False})
+        assert "\n" not in config_file.read_text()
+
+        config.save_config({"model": "gpt-4o", "verbose": True})
+        assert "\n" in config_file.read_text()
+
+
+class TestConfigTemplates:
+    """Test the shared DEFAULT_CONFIG and RESPONSE_STYLES templates."""
+
+    def test_templates_are_read_only(self):
+        """Test the module-level templates cannot be mutated in place."""
+        with pytest.raises(TypeError):
+            config.DEFAULT_CONFIG["model"] = "changed"
+        with pytest.raises(TypeError):
+            config.RESPONSE_STYLES["concise"]["max_tokens"] = 1
+
+    def test_styles_match_response_styles(self):
+        """Test the tuple form carries the same values as the dict form."""
+        for name, style in config.RESPONSE_STYLES.items():
+            assert config.STYLES[name]._asdict() == {
+                "temperature_override": None, **style}
+
+    def test_get_style_unknown_falls_back(self):
+        """Test get_style resolves unknown names to the default style."""
+        assert config.get_style("unknown") is config.STYLES["descriptive"]
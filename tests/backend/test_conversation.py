@@ -0,0 +1,125 @@
+"""
+Tests for conversation history storage and live event delivery.
+"""
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.services import conversation
+
+
+@pytest.fixture
+def history_file(tmp_path, monkeypatch):
+    """Keep history writes in a temporary file and start empty."""
+    monkeypatch.setattr(conversation, "CONVERSATIONS_FILE",
+                        tmp_path / "conversations.jsonl")
+    monkeypatch.setattr(conversation, "conversation_history", [])
+    monkeypatch.setattr(conversation, "_subscribers", [])
+    return tmp_path / "conversations.jsonl"
+
+
+class TestSubscriptions:
+    """Test subscribe()/unsubscribe() event delivery."""
+
+    @pytest.mark.asyncio
+    async def test_new_entry_is_delivered(self, history_file):
+        """Test subscribers receive each new conversation."""
+        queue = conversation.subscribe()
+
+        conversation.add_to_history("hi", "hello", "execute_command")
+
+        kind, entry = await asyncio.wait_for(queue.get(), 1)
+        assert kind == "entry"
+        assert entry["user_input"] == "hi"
+        assert entry["assistant_response"] == "hello"
+
+    @pytest.mark.asyncio
+    async def test_clear_is_delivered(self, history_file):
+        """Test subscribers are told when the history is cleared."""
+        queue = conversation.subscribe()
+
+        conversation.clear_history()
+
+        assert await asyncio.wait_for(queue.get(), 1) == ("clear", None)
+
+    @pytest.mark.asyncio
+    async def test_entries_from_worker_threads_are_delivered(self, history_file):
+        """Test entries added off the event loop still reach subscribers."""
+        queue = conversation.subscribe()
+
+        thread = threading.Thread(target=conversation.add_to_history,
+                                  args=("hi", "hello", "guidance"))
+        thread.start()
+        thread.join()
+
+        kind, entry = await asyncio.wait_for(queue.get(), 1)
+        assert (kind, entry["command_type"]) == ("entry", "guidance")
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_queue_receives_nothing(self, history_file):
+        """Test unsubscribe() stops delivery."""
+        queue = conversation.subscribe()
+        conversation.unsubscribe(queue)
+
+        conversation.add_to_history("hi", "hello", "execute_command")
+        await asyncio.sleep(0)
+
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_events(self, history_file, monkeypatch):
+        """Test a full queue drops new events instead of blocking writers."""
+        monkeypatch.setattr(conversation, "SUBSCRIBER_QUEUE_SIZE", 1)
+        queue = conversation.subscribe()
+
+        conversation.add_to_history("one", "1", "execute_command")
+        conversation.add_to_history("two", "2", "execute_command")
+        await asyncio.sleep(0)
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait()[1]["user_input"] == "one"
+
+
+class TestStreamEndpoint:
+    """Test /api/conversations/stream subscription lifetime."""
+
+    @pytest.mark.asyncio
+    async def test_subscribes_only_while_streaming(self, history_file):
+        """Test the queue exists only between the first chunk and close."""
+        from main import app
+        route = next(r for r in app.routes
+                     if getattr(r, "path", None) == "/api/conversations/stream")
+
+        response = await route.endpoint()
+        assert conversation._subscribers == []
+
+        events = response.body_iterator
+        asyncio.get_running_loop().call_later(
+            0.01, conversation.add_to_history, "hi", "hello", "execute_command")
+        chunk = await events.__anext__()
+        assert '"user_input": "hi"' in chunk
+        assert len(conversation._subscribers) == 1
+
+        await events.aclose()
+        assert conversation._subscribers == []
+
+
+class TestGetHistory:
+    """Test get_history()."""
+
+    @pytest.mark.parametrize("limit", [None, 0, 2, 10])
+    def test_newest_first_reverses_the_same_entries(self, history_file,
+                                                   monkeypatch, limit):
+        """Test newest_first returns the limited entries in reverse order."""
+        entries = [{"user_input": str(i)} for i in range(5)]
+        monkeypatch.setattr(conversation, "conversation_history", entries)
+
+        oldest_first = conversation.get_history(limit)
+
+        assert conversation.get_history(limit, newest_first=True) == (
+            oldest_first[::-1])
@@ -0,0 +1,588 @@
+"""
+Tests for dashboard template loading and serving.
+"""
+import gzip
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import Request
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import app.dashboard as dashboard
+
+
+def make_request(accept_encoding=None, if_none_match=None):
+    """Build a bare GET request with optional negotiation headers."""
+    headers = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.fixture
+def templates_dir(tmp_path, monkeypatch):
+    """Point TEMPLATES_DIR at a temporary directory with a cold cache."""
+    monkeypatch.setattr(dashboard, "TEMPLATES_DIR", str(tmp_path))
+    monkeypatch.setattr(dashboard, "_TEMPLATE_CACHE", {})
+    monkeypatch.setattr(dashboard, "_ASSETS", {})
+    return tmp_path
+
+
+class TestLoadTemplate:
+    """Test load_template()."""
+
+    def test_reads_template(self, templates_dir):
+        """Test the template contents are returned UTF-8 encoded."""
+        (templates_dir / "page.html").write_text("<h1>🎮 Hub</h1>", encoding="utf-8")
+        assert dashboard.load_template("page.html") == "<h1>🎮 Hub</h1>".encode()
+
+    def test_repeated_loads_reuse_cached_bytes(self, templates_dir):
+        """Test an unchanged file is not read again."""
+        (templates_dir / "page.html").write_text("<p>one</p>")
+
+        first = dashboard.load_template("page.html")
+
+        assert dashboard.load_template("page.html") is first
+
+    def test_file_change_is_picked_up(self, templates_dir):
+        """Test an edited template is re-read."""
+        page = templates_dir / "page.html"
+        page.write_text("<p>one</p>")
+        dashboard.load_template("page.html")
+
+        page.write_text("<p>two, longer</p>")
+
+        assert dashboard.load_template("page.html") == b"<p>two, longer</p>"
+
+    def test_missing_template_raises(self, templates_dir):
+        """Test a missing template is reported, not cached."""
+        with pytest.raises(FileNotFoundError):
+            dashboard.load_template("missing.html")
+
+    def test_bundled_dashboard_exists(self):
+        """Test the served dashboard template ships with the app."""
+        assert os.path.isfile(
+            os.path.join(dashboard.TEMPLATES_DIR, "unified_dashboard.html"))
+
+
+class TestMinifyCss:
+    """Test minify_css() and inline stylesheet minification."""
+
+    def test_strips_comments_and_whitespace(self):
+        """Test comments, indentation and trailing semicolons are removed."""
+        css = """
+            /* Header */
+            .header {
+                padding: 30px;
+                margin: 0 auto;
+            }
+        """
+        assert dashboard.minify_css(css) == ".header{padding: 30px;margin: 0 auto}"
+
+    def test_preserves_strings(self):
+        """Test whitespace inside quoted strings is untouched."""
+        css = '.a::after { content: "x  ;  {y}"; font-family: \'Inter\', sans-serif; }'
+        assert dashboard.minify_css(css) == (
+            '.a::after{content: "x  ;  {y}";font-family: \'Inter\',sans-serif}')
+
+    def test_keeps_descendant_pseudo_selectors(self):
+        """Test a space before a pseudo-class is not collapsed away."""
+        assert dashboard.minify_css(".a :hover { color: red; }") == ".a :hover{color: red}"
+
+    def test_served_template_is_minified(self, templates_dir):
+        """Test <style> blocks are minified while the markup is untouched."""
+        (templates_dir / "page.html").write_text(
+            "<html>\n  <style>\n    body {\n      margin: 0;\n    }\n  </style>\n</html>")
+
+        assert dashboard.load_template("page.html") == (
+            b"<html>\n  <style>body{margin: 0}</style>\n</html>")
+
+
+class TestTemplateResponse:
+    """Test template_response()."""
+
+    def test_serves_cached_bytes(self, templates_dir):
+        """Test the response body is the cached template bytes."""
+        (templates_dir / "page.html").write_text("<p>hub</p>")
+
+        response = dashboard.template_response("page.html", make_request())
+
+        assert response.body == b"<p>hub</p>"
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.headers["content-length"] == "10"
+        assert response.headers["cache-control"] == dashboard.PAGE_CACHE_CONTROL
+        assert "content-encoding" not in response.headers
+
+    def test_gzip_when_accepted(self, templates_dir, monkeypatch):
+        """Test gzip clients get the pre-compressed body."""
+        monkeypatch.setattr(dashboard, "HAS_BROTLI", False)
+        (templates_dir / "page.html").write_text("<p>hub</p>" * 100)
+
+        response = dashboard.template_response(
+            "page.html", make_request("gzip, deflate, br"))
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert gzip.decompress(response.body) == b"<p>hub</p>" * 100
+
+    def test_refused_encoding_is_not_used(self, templates_dir):
+        """Test a coding refused with q=0 falls back to the plain body."""
+        (templates_dir / "page.html").write_text("<p>hub</p>")
+
+        response = dashboard.template_response(
+            "page.html", make_request("gzip;q=0, br; q=0"))
+
+        assert response.body == b"<p>hub</p>"
+        assert "content-encoding" not in response.headers
+
+
+class TestScriptAssets:
+    """Test extraction of inline scripts into cacheable assets."""
+
+    def test_inline_script_is_replaced_by_deferred_asset(self, templates_dir):
+        """Test the page references the script instead of embedding it."""
+        (templates_dir / "page.html").write_text(
+            "<body><p>hub</p><script>init();</script></body>")
+
+        html = dashboard.load_template("page.html").decode()
+
+        assert "init();" not in html
+        src = re.search(r'<script defer src="/static/(page\.[0-9a-f]{12}\.js)"></script>',
+                        html)
+        assert src is not None
+
+        response = dashboard.asset_response(src.group(1), make_request())
+        assert response.body == b"init();"
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert response.headers["cache-control"] == dashboard.ASSET_CACHE_CONTROL
+
+    def test_external_scripts_are_left_alone(self, templates_dir):
+        """Test <script src> tags are not touched."""
+        (templates_dir / "page.html").write_text('<script src="/x.js"></script>')
+        assert dashboard.load_template("page.html") == b'<script src="/x.js"></script>'
+
+    def test_asset_loads_its_template_on_demand(self, templates_dir, monkeypatch):
+        """Test an asset can be served before its page in this process."""
+        (templates_dir / "page.html").write_text("<script>init();</script>")
+        html = dashboard.load_template("page.html").decode()
+        asset = re.search(r"/static/([^\"]+)", html).group(1)
+        monkeypatch.setattr(dashboard, "_TEMPLATE_CACHE", {})
+        monkeypatch.setattr(dashboard, "_ASSETS", {})
+
+        assert dashboard.asset_response(asset, make_request()).body == b"init();"
+
+    def test_unknown_asset_returns_none(self, templates_dir):
+        """Test names that no template provides are rejected."""
+        assert dashboard.asset_response("page.0123456789ab.js", make_request()) is None
+        assert dashboard.asset_response("../config.json", make_request()) is None
+
+    def test_edited_template_drops_old_assets(self, templates_dir):
+        """Test superseded script assets are no longer served."""
+        page = templates_dir / "page.html"
+        page.write_text("<script>one();</script>")
+        old = re.search(r"/static/([^\"]+)",
+                        dashboard.load_template("page.html").decode()).group(1)
+        page.write_text("<script>two_longer();</script>")
+        dashboard.load_template("page.html")
+
+        assert dashboard.asset_response(old, make_request()) is None
+
+
+class TestPreparePage:
+    """Test pages are built off the event loop."""
+
+    @pytest.fixture
+    def builds(self, monkeypatch):
+        """Record the thread each page's compression runs in."""
+        threads = []
+        compress = dashboard._compress
+
+        def recording_compress(data):
+            threads.append(threading.get_ident())
+            return compress(data)
+
+        monkeypatch.setattr(dashboard, "_compress", recording_compress)
+        return threads
+
+    @pytest.mark.asyncio
+    async def test_cold_page_is_built_in_worker_thread(self, templates_dir, builds):
+        """Test a cache miss is built outside the event loop thread."""
+        (templates_dir / "page.html").write_text("<p>hub</p>")
+
+        await dashboard.prepare_page("page.html")
+
+        assert builds and threading.get_ident() not in builds
+        assert dashboard._is_current("page.html")
+
+    @pytest.mark.asyncio
+    async def test_current_page_is_not_rebuilt(self, templates_dir, builds):
+        """Test a cached page skips the worker thread."""
+        (templates_dir / "page.html").write_text("<p>hub</p>")
+        await dashboard.prepare_page("page.html")
+        builds.clear()
+
+        await dashboard.prepare_page("page.html")
+        dashboard.template_response("page.html", make_request())
+
+        assert builds == []
+
+    @pytest.mark.asyncio
+    async def test_asset_builds_its_template_in_worker_thread(self, templates_dir,
+                                                              builds):
+        """Test an unknown asset's page is built before it is served."""
+        (templates_dir / "page.html").write_text("<script>init();</script>")
+        html = dashboard.load_template("page.html").decode()
+        asset = re.search(r"/static/([^\"]+)", html).group(1)
+        dashboard._TEMPLATE_CACHE.clear()
+        dashboard._ASSETS.clear()
+        builds.clear()
+
+        await dashboard.prepare_asset(asset)
+        response = dashboard.asset_response(asset, make_request())
+
+        assert builds and threading.get_ident() not in builds
+        assert response.body == b"init();"
+
+
+class TestDeferredCss:
+    """Test splitting of inline stylesheets at DEFERRED_CSS_MARKER."""
+
+    def test_rules_after_marker_become_deferred_asset(self, templates_dir):
+        """Test only the critical rules stay inline."""
+        (templates_dir / "page.html").write_text(
+            "<style>body { margin: 0; }\n/* @deferred */\n.card { padding: 8px; }</style>")
+
+        html = dashboard.load_template("page.html").decode()
+
+        assert html.startswith("<style>body{margin: 0}</style>")
+        assert ".card" not in html
+        href = re.search(
+            r'<link rel="stylesheet" href="/static/(page\.[0-9a-f]{12}\.css)" '
+            r'media="print" onload="this.media=\'all\'">', html)
+        assert href is not None
+        assert f'<noscript><link rel="stylesheet" href="/static/{href.group(1)}">' in html
+
+        response = dashboard.asset_response(href.group(1), make_request())
+        assert response.body == b".card{padding: 8px}"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.headers["cache-control"] == dashboard.ASSET_CACHE_CONTROL
+
+    def test_bundled_dashboard_keeps_first_paint_css_inline(self):
+        """Test the served dashboard still inlines its header and tab styles."""
+        html = dashboard.load_template("unified_dashboard.html").decode()
+        inline = re.search(r"<style>(.*?)</style>", html, re.DOTALL).group(1)
+
+        assert "font-family: 'Inter'" in inline
+        assert ".tab-content" in inline
+        assert ".sub-tab" not in inline
+
+
+# Minimal DOM for running dashboard functions under node: elements keep
+# their children, class name and textContent only
+FAKE_DOM_JS = """
+class El {
+    constructor(cls, children = []) {
+        this.className = cls; this.children = children;
+        this.textContent = ''; this.style = {};
+    }
+    querySelector(sel) {
+        for (const child of this.children) {
+            if ('.' + child.className === sel) return child;
+            const found = child.querySelector(sel);
+            if (found) return found;
+        }
+        return null;
+    }
+    cloneNode() {
+        return new El(this.className, this.children.map(c => c.cloneNode()));
+    }
+    appendChild(child) { child.parent = this; this.children.push(child); }
+    prepend(child) { child.parent = this; this.children.unshift(child); }
+    remove() { this.parent.children.splice(this.parent.children.indexOf(this), 1); }
+    replaceChildren(...nodes) {
+        renders++;
+        this.children = nodes.flatMap(n => n.fragment ? n.children : [n]);
+        this.children.forEach(child => { child.parent = this; });
+    }
+    get lastElementChild() { return this.children[this.children.length - 1]; }
+}
+const entry = new El('conversation-entry', ['conversation-time', 'command-tag',
+    'conversation-user', 'conversation-assistant'].map(c => new El(c)));
+const elements = {
+    'conversation-history': new El('history'),
+    'no-conversations-message': new El('empty'),
+    'conversation-entry-template': {content: {firstElementChild: entry}},
+    'totalCommands': new El('total'),
+};
+const EL = {
+    history: elements['conversation-history'],
+    noConversations: elements['no-conversations-message'],
+    conversationTemplate: elements['conversation-entry-template'],
+    totalCommands: elements['totalCommands'],
+};
+const document = {
+    getElementById: id => elements[id],
+    createDocumentFragment: () => Object.assign(new El('fragment'), {fragment: true}),
+};
+const state = {conversations: []};
+const log = () => {};
+const requestAnimationFrame = callback => setTimeout(callback, 0);
+let renders = 0;
+"""
+
+
+CONVERSATION_DOM_JS = """{
+    users: elements['conversation-history'].children.map(
+        e => e.querySelector('.conversation-user').textContent),
+    emptyMessage: elements['no-conversations-message'].style.display,
+    total: elements['totalCommands'].textContent,
+    renders,
+}"""
+
+
+def run_dashboard_js(script, calls, result=CONVERSATION_DOM_JS):
+    """
+    Run dashboard functions against FAKE_DOM_JS.
+
+    Returns the JS expression result, evaluated once pending frames ran;
+    by default the state of the conversation list.
+    """
+    program = FAKE_DOM_JS + script + """
+(async () => {
+    %s
+    await new Promise(resolve => setTimeout(resolve, 0));
+    console.log(JSON.stringify(%s));
+})();
+""" % (calls, result)
+    output = subprocess.run(["node", "-e", program], capture_output=True,
+                            text=True, check=True)
+    return json.loads(output.stdout)
+
+
+def served_script(name, *names):
+    """
+    Return top-level functions and let/const declarations from a served
+    page's script, or the whole script if no names are given.
+    """
+    html = dashboard.load_template(name).decode()
+    asset = re.search(r'<script defer src="/static/([^"]+\.js)"></script>', html)
+    script = dashboard.asset_response(asset.group(1), make_request()).body.decode()
+    if not names:
+        return script
+    sources = []
+    for name in names:
+        match = re.search(rf"(async )?function {name}\(|(let|const) {name} = ",
+                          script)
+        start = match.start()
+        if match.group(2):
+            end = script.index(";\n", start) + 2
+        else:
+            end = script.index("\n        }\n", start) + len("\n        }\n")
+        sources.append(script[start:end])
+    return "\n".join(sources)
+
+
+# What the conversation list needs from the served script
+RENDER_NAMES = ("renderConversationEntry", "formatTimestamp", "timestampFormat",
+                "timestampCache", "TIMESTAMP_CACHE_SIZE")
+LOAD_NAMES = ("loadConversations", "conversationsKey", "flushConversations",
+              "abortConversationsRequest", "lastConversationsKey",
+              "pendingConversations", "conversationsRequest") + RENDER_NAMES
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+class TestUnifiedDashboardConversations:
+    """Test the served dashboard's conversation rendering."""
+
+    def test_conversations_are_rendered(self):
+        """Test entries from /api/conversations (which has no "success") render."""
+        payload = {"conversations": [
+            {"timestamp": "2025-01-01T00:00:00", "command_type": "execute_command",
+             "user_input": "<b>hi</b>", "assistant_response": "hello"},
+            {"timestamp": "2025-01-01T00:00:01", "command_type": None,
+             "user_input": "second", "assistant_response": "ok"},
+        ], "total": 2, "max_size": 1000}
+        fetch = "const fetch = async () => ({json: async () => (%s)});" % (
+            json.dumps(payload))
+
+        dom = run_dashboard_js(
+            fetch + served_script("unified_dashboard.html", *LOAD_NAMES),
+            "await loadConversations();")
+
+        assert dom == {"users": ["<b>hi</b>", "second"], "emptyMessage": "none",
+                       "total": 2, "renders": 1}
+
+    def test_unchanged_reload_skips_rendering(self):
+        """Test a reload returning the same list leaves the DOM alone."""
+        payload = {"conversations": [
+            {"timestamp": "2025-01-01T00:00:00", "user_input": "hi",
+             "assistant_response": "hello"}], "total": 1}
+        fetch = "const fetch = async () => ({json: async () => (%s)});" % (
+            json.dumps(payload))
+
+        dom = run_dashboard_js(
+            fetch + served_script("unified_dashboard.html", *LOAD_NAMES),
+            "await loadConversations(); await loadConversations();")
+
+        assert dom["users"] == ["hi"] and dom["renders"] == 1
+
+    def test_superseded_load_is_aborted(self):
+        """Test a slow earlier load is cancelled instead of rendering late."""
+        fetch = """
+            let fetches = 0;
+            const fetch = (url, {signal}) => new Promise((resolve, reject) => {
+                const first = fetches++ === 0;
+                const conversations = [{timestamp: first ? 'old' : 'new',
+                    user_input: first ? 'stale' : 'fresh', assistant_response: ''}];
+                const timer = setTimeout(() => resolve({json: async () => (
+                    {conversations, total: 1})}), first ? 20 : 0);
+                signal.addEventListener('abort', () => {
+                    clearTimeout(timer);
+                    reject(Object.assign(new Error('aborted'), {name: 'AbortError'}));
+                });
+            });
+        """
+
+        dom = run_dashboard_js(
+            fetch + served_script("unified_dashboard.html", *LOAD_NAMES),
+            "await Promise.all([loadConversations(), loadConversations()]);")
+
+        assert dom["users"] == ["fresh"] and dom["renders"] == 1
+
+    def test_timestamps_match_to_locale_string(self):
+        """Test the shared formatter matches toLocaleString() and memoizes."""
+        script = served_script("unified_dashboard.html", "formatTimestamp",
+                               "timestampFormat", "timestampCache",
+                               "TIMESTAMP_CACHE_SIZE")
+        result = run_dashboard_js(script, "const iso = '2025-03-04T05:06:07';", """{
+            same: formatTimestamp(iso) === new Date(iso).toLocaleString(),
+            cached: timestampCache.has(iso),
+            invalid: formatTimestamp('not a date'),
+        }""")
+
+        assert result == {"same": True, "cached": True, "invalid": "Invalid Date"}
+
+    def test_empty_history_shows_message(self):
+        """Test an empty history shows the empty state."""
+        fetch = ("const fetch = async () => "
+                 "({json: async () => ({conversations: []})});")
+
+        dom = run_dashboard_js(
+            fetch + served_script("unified_dashboard.html", *LOAD_NAMES),
+            "await loadConversations();")
+
+        assert dom["users"] == [] and dom["emptyMessage"] == "block"
+
+    def test_streamed_conversation_is_prepended(self):
+        """Test a streamed entry lands on top and the list stays at 50."""
+        script = served_script("unified_dashboard.html", "prependConversation",
+                               *RENDER_NAMES, "flushConversations",
+                               "lastConversationsKey", "pendingConversations")
+        calls = """
+            for (let i = 0; i < 51; i++) {
+                prependConversation({timestamp: '2025-01-01T00:00:00',
+                                     user_input: 'q' + i, assistant_response: 'a'});
+            }
+        """
+
+        dom = run_dashboard_js(script, calls)
+
+        assert len(dom["users"]) == dom["total"] == 50
+        assert dom["users"][0] == "q50" and dom["users"][-1] == "q1"
+        assert dom["emptyMessage"] == "none"
+
+
+class TestUnifiedDashboardElements:
+    """Test the served dashboard's EL element map."""
+
+    def test_every_cached_element_exists(self):
+        """Test each id looked up once in EL is present in the page."""
+        html = dashboard.load_template("unified_dashboard.html").decode()
+        script = served_script("unified_dashboard.html")
+        block = script[script.index("const EL = {"):]
+        block = block[:block.index("};")]
+        ids = re.findall(r"getElementById\('([^']+)'\)", block)
+
+        assert len(ids) == 11
+        for element_id in ids:
+            assert f'id="{element_id}"' in html
+
+
+    def test_visible_text_uses_no_emoji(self):
+        """Test icons come from the icon font rather than color emoji."""
+        html = dashboard.load_template("unified_dashboard.html").decode()
+        page = html + served_script("unified_dashboard.html")
+        visible = [line for line in page.splitlines()
+                   if not re.search(r"console\.(log|error|warn)", line)]
+
+        assert not re.findall("[\U0001F300-\U0001FAFF\u2600-\u27BF]",
+                              "\n".join(visible))
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+class TestUnifiedDashboardVisibility:
+    """Test the served dashboard holds off background work while hidden."""
+
+    def test_hidden_tab_defers_websocket_reconnect(self):
+        """Test a reconnect due while hidden waits for the tab to show."""
+        script = """
+            let sockets = 0;
+            class WebSocket { constructor() { sockets++; } }
+            const window = {location: {protocol: 'http:', host: 'localhost'}};
+        """ + served_script("unified_dashboard.html", "initWebSocket",
+                              "wsReconnectPending")
+
+        result = run_dashboard_js(
+            script, "document.hidden = true; initWebSocket();",
+            "{sockets, wsReconnectPending}")
+
+        assert result == {"sockets": 0, "wsReconnectPending": True}
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation in template_response()."""
+
+    def test_matching_etag_returns_304(self, templates_dir):
+        """Test a revalidation with the current ETag gets an empty 304."""
+        (templates_dir / "page.html").write_text("<p>hub</p>")
+        etag = dashboard.template_response("page.html", make_request()).headers["etag"]
+
+        response = dashboard.template_response(
+            "page.html", make_request(if_none_match=etag))
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_page(self, templates_dir):
+        """Test an ETag from before an edit gets the new page."""
+        page = templates_dir / "page.html"
+        page.write_text("<p>one</p>")
+        etag = dashboard.template_response("page.html", make_request()).headers["etag"]
+        page.write_text("<p>two, longer</p>")
+
+        response = dashboard.template_response(
+            "page.html", make_request(if_none_match=etag))
+
+        assert response.status_code == 200
+        assert response.body == b"<p>two, longer</p>"
+        assert response.headers["etag"] != etag
+
+    def test_encodings_have_distinct_etags(self, templates_dir):
+        """Test the gzip and plain bodies are not confused by caches."""
+        (templates_dir / "page.html").write_text("<p>hub</p>")
+
+        plain = dashboard.template_response("page.html", make_request())
+        gzipped = dashboard.template_response("page.html", make_request("gzip"))
+
+        assert plain.headers["etag"] != gzipped.headers["etag"]
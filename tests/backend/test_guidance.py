@@ -0,0 +1,47 @@
+"""
+Tests for the guidance service request building.
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.models import BlueprintCapture, GuidanceRequest
+from app.services.guidance import GuidanceService
+
+
+def make_capture(**images):
+    """Build a blueprint capture with the given image fields."""
+    return BlueprintCapture(blueprint_name="BP_Door",
+                            blueprint_path="/Game/BP_Door",
+                            capture_id="capture_1",
+                            timestamp="2025-01-01T00:00:00",
+                            **images)
+
+
+def sent_images(capture):
+    """Run generate_guidance and return the image URLs sent to OpenAI."""
+    request = GuidanceRequest(query="How do I open the door?",
+                              blueprint_captures=[capture])
+    with patch("app.services.guidance.openai") as openai:
+        openai.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Use a timeline."))])
+        GuidanceService().generate_guidance(request)
+    content = openai.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+    return [part["image_url"]["url"] for part in content
+            if part["type"] == "image_url"]
+
+
+class TestBlueprintImages:
+    """Test how blueprint capture images reach the vision model."""
+
+    def test_image_url_is_passed_by_reference(self):
+        """Test hosted captures are not inlined."""
+        capture = make_capture(image_url="https://example.com/bp.png")
+        assert sent_images(capture) == ["https://example.com/bp.png"]
+
+    def test_base64_image_is_inlined(self):
+        """Test captures without a URL are sent as a data URL."""
+        capture = make_capture(image_base64="iVBORw0KGgo=")
+        assert sent_images(capture) == ["data:image/png;base64,iVBORw0KGgo="]
@@ -0,0 +1,129 @@
+"""
+Tests for the OpenAI chat reply cache.
+"""
+import json
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.services import llm_cache, openai_client
+from app.services.llm_cache import LLMCache, cache_key, caching_enabled
+from app.services.openai_client import call_openai_chat, to_prompt_json
+
+MESSAGES = [{"role": "user", "content": "What is in the viewport?"}]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Swap in an empty global cache."""
+    fresh = LLMCache()
+    monkeypatch.setattr(llm_cache, "_cache", fresh)
+    return fresh
+
+
+@pytest.fixture
+def create(monkeypatch):
+    """Replace the async client's chat.completions.create with a mock."""
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock()
+    monkeypatch.setattr(openai_client, "_async_client", client)
+    return client.chat.completions.create
+
+
+def completion(content):
+    """Build a fake chat completion with the given reply."""
+    response = MagicMock()
+    response.choices[0].message.content = content
+    return response
+
+
+class TestCacheKey:
+    """Test cache_key()."""
+
+    def test_equal_requests_share_a_key(self):
+        """Test keys ignore dict ordering within messages."""
+        reordered = [{"content": "What is in the viewport?", "role": "user"}]
+        assert cache_key("gpt-4o", MESSAGES, 0) == cache_key("gpt-4o", reordered, 0)
+
+    def test_model_and_temperature_are_part_of_the_key(self):
+        """Test a different model or temperature misses."""
+        key = cache_key("gpt-4o", MESSAGES, 0)
+        assert key != cache_key("gpt-4o-mini", MESSAGES, 0)
+        assert key != cache_key("gpt-4o", MESSAGES, 0.7)
+
+    def test_caching_enabled(self):
+        """Test caching is on at temperature 0 or when opted in."""
+        assert caching_enabled({"temperature": 0})
+        assert caching_enabled({"temperature": 0.7, "cache_responses": True})
+        assert not caching_enabled({"temperature": 0.7})
+        assert not caching_enabled({})
+
+
+class TestLLMCache:
+    """Test LLMCache eviction and expiry."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test a read keeps an entry alive past older ones."""
+        cache = LLMCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ("1", "3")
+
+    def test_expired_entry_is_dropped(self, monkeypatch):
+        """Test entries older than the TTL are not served."""
+        cache = LLMCache(ttl=10)
+        monkeypatch.setattr(llm_cache.time, "monotonic", lambda: 100.0)
+        cache.set("a", "1")
+
+        monkeypatch.setattr(llm_cache.time, "monotonic", lambda: 110.0)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestCallOpenAIChat:
+    """Test call_openai_chat()."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_is_served_from_cache(self, create, cache):
+        """Test an identical cached request does not call the API again."""
+        create.return_value = completion("A cube.")
+
+        first = await call_openai_chat("gpt-4o", MESSAGES, 0, use_cache=True)
+        second = await call_openai_chat("gpt-4o", MESSAGES, 0, use_cache=True)
+
+        assert first == second == "A cube."
+        create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_uncached_requests_always_call_the_api(self, create, cache):
+        """Test use_cache=False neither reads nor fills the cache."""
+        create.return_value = completion(None)
+
+        assert await call_openai_chat("gpt-4o", MESSAGES, 0.7) == ""
+        await call_openai_chat("gpt-4o", MESSAGES, 0.7)
+
+        assert create.await_count == 2
+        assert len(cache) == 0
+
+
+class TestToPromptJson:
+    """Test to_prompt_json()."""
+
+    def test_matches_indented_json(self):
+        """Test the output is the same two-space indented JSON as before."""
+        data = {"actors": [{"name": "Cube", "location": [1.5, 2, 3]}], "x": None}
+        assert to_prompt_json(data) == json.dumps(data, indent=2)
+
+    def test_values_orjson_rejects_fall_back(self):
+        """Test out-of-range integers are still serialized."""
+        assert to_prompt_json({"n": 2 ** 70}) == '{\n  "n": 1180591620717411303424\n}'
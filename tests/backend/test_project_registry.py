@@ -0,0 +1,154 @@
+"""
+Tests for the project registry and its on-disk persistence.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import app.project_registry as project_registry
+from app.project_registry import ProjectRegistry
+
+
+@pytest.fixture
+def registry_file(tmp_path):
+    """Registry file path inside a temporary directory."""
+    return tmp_path / "project_registry.json"
+
+
+class TestPersistence:
+    """Test _save_registry() and _load_registry()."""
+
+    def test_round_trip(self, registry_file):
+        """Test a saved registry loads back unchanged."""
+        registry = ProjectRegistry(registry_file)
+        registry.register_project("abc", {"name": "Shooter 🎮", "path": "/p/Shooter"})
+
+        reloaded = ProjectRegistry(registry_file)
+
+        assert reloaded.projects == registry.projects
+        assert reloaded.active_project_id == "abc"
+
+    def test_file_is_standard_json(self, registry_file):
+        """Test the file stays readable by the stdlib json module."""
+        ProjectRegistry(registry_file).register_project(
+            "abc", {"name": "Shooter", "path": "/p/Shooter"})
+
+        data = json.loads(registry_file.read_text(encoding="utf-8"))
+
+        assert data["active_project_id"] == "abc"
+        assert data["projects"]["abc"]["name"] == "Shooter"
+
+    def test_stdlib_fallback(self, registry_file, monkeypatch):
+        """Test the registry still persists without orjson."""
+        monkeypatch.setattr(project_registry, "HAS_ORJSON", False)
+        ProjectRegistry(registry_file).register_project(
+            "abc", {"name": "Shooter", "path": "/p/Shooter"})
+
+        assert ProjectRegistry(registry_file).get_project("abc")["name"] == "Shooter"
+
+    def test_save_leaves_no_temp_files(self, registry_file):
+        """Test the atomic write cleans up after itself."""
+        ProjectRegistry(registry_file).register_project(
+            "abc", {"name": "Shooter", "path": "/p/Shooter"})
+
+        assert [p.name for p in registry_file.parent.iterdir()] == [registry_file.name]
+
+    def test_unchanged_registry_is_not_rewritten(self, registry_file, monkeypatch):
+        """Test saves that would write identical bytes are skipped."""
+        registry = ProjectRegistry(registry_file)
+        registry.register_project("abc", {"name": "Shooter", "path": "/p/Shooter"})
+        replaced = []
+        monkeypatch.setattr(project_registry.os, "replace",
+                            lambda *args: replaced.append(args))
+
+        registry.set_active_project("abc")
+        registry.set_active_project("abc")
+
+        assert replaced == []
+
+    def test_loaded_registry_is_not_rewritten(self, registry_file, monkeypatch):
+        """Test a registry freshly read from disk counts as saved."""
+        ProjectRegistry(registry_file).register_project(
+            "abc", {"name": "Shooter", "path": "/p/Shooter"})
+        replaced = []
+        monkeypatch.setattr(project_registry.os, "replace",
+                            lambda *args: replaced.append(args))
+
+        ProjectRegistry(registry_file).set_active_project("abc")
+
+        assert replaced == []
+
+    def test_corrupt_file_starts_empty(self, registry_file):
+        """Test an unreadable file leaves the registry empty."""
+        registry_file.write_text("{not json")
+
+        registry = ProjectRegistry(registry_file)
+
+        assert registry.projects == {}
+        assert registry.active_project_id is None
+
+
+class TestRegisterProject:
+    """Test register_project()."""
+
+    def test_new_project_timestamps_match(self, registry_file):
+        """Test a new project is registered and updated at the same instant."""
+        registry = ProjectRegistry(registry_file)
+        registry.register_project("abc", {"name": "Shooter", "path": "/p/Shooter"})
+
+        project = registry.get_project("abc")
+
+        assert project["registered_at"] == project["last_updated"]
+
+    def test_reregistering_keeps_registration_time(self, registry_file):
+        """Test updating a project keeps its original registered_at."""
+        registry = ProjectRegistry(registry_file)
+        registry.register_project("abc", {"name": "Shooter", "path": "/p/Shooter"})
+        registry.projects["abc"]["registered_at"] = "2020-01-01T00:00:00"
+
+        registry.register_project("abc", {"name": "Shooter 2", "path": "/p/Shooter"})
+
+        assert registry.get_project("abc")["registered_at"] == "2020-01-01T00:00:00"
+
+
+class TestBulkUpdate:
+    """Test bulk_update() and register_projects()."""
+
+    def test_register_projects_saves_once(self, registry_file, monkeypatch):
+        """Test a batch registration writes the file a single time."""
+        registry = ProjectRegistry(registry_file)
+        replaced = []
+        original_replace = project_registry.os.replace
+        monkeypatch.setattr(project_registry.os, "replace",
+                            lambda *args: replaced.append(original_replace(*args)))
+
+        results = registry.register_projects({
+            "abc": {"name": "Shooter", "path": "/p/Shooter"},
+            "def": {"name": "Racer", "path": "/p/Racer"},
+        })
+
+        assert [r["project_id"] for r in results] == ["abc", "def"]
+        assert len(replaced) == 1
+        assert set(ProjectRegistry(registry_file).projects) == {"abc", "def"}
+
+    def test_nothing_is_written_inside_the_block(self, registry_file):
+        """Test mutations only reach disk when the outermost block exits."""
+        registry = ProjectRegistry(registry_file)
+
+        with registry.bulk_update():
+            with registry.bulk_update():
+                registry.register_project("abc", {"name": "Shooter", "path": "/p/Shooter"})
+            assert not registry_file.exists()
+
+        assert ProjectRegistry(registry_file).get_project("abc") is not None
+
+    def test_block_without_changes_writes_nothing(self, registry_file):
+        """Test an empty block does not create the file."""
+        with ProjectRegistry(registry_file).bulk_update():
+            pass
+
+        assert not registry_file.exists()
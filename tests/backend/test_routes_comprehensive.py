@@ -3,6 +3,7 @@ Comprehensive Backend Routes Testing
 Tests every route, handler, and endpoint in the backend API.
 Organized by functional area for maintainability.
 """
+import asyncio
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
@@ -13,6 +14,7 @@ from fastapi.testclient import TestClient
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import app.routes as routes
 from main import app
 
 client = TestClient(app)
@@ -174,6 +176,38 @@ class TestCommandRoutingRoutes:
         assert response.status_code == 200
 
 
+class TestExecuteCommandConcurrency:
+    """Test concurrent /execute_command turns for one project."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_turns_keep_both_exchanges(self, monkeypatch):
+        """Test overlapping turns are stored whole and in order."""
+        registry = MagicMock()
+        stored = {"session_messages": []}
+        registry.get_session_messages.side_effect = (
+            lambda project_id: stored["session_messages"])
+        registry.set_session_messages.side_effect = (
+            lambda project_id, messages: stored.update(session_messages=messages))
+
+        async def reply(model, messages, temperature, use_cache=False):
+            await asyncio.sleep(0.01)
+            return "re: " + messages[-1]["content"]
+
+        monkeypatch.setattr(routes, "get_registry", lambda: registry)
+        monkeypatch.setattr(routes, "call_openai_chat", reply)
+        monkeypatch.setattr(routes.conversation, "add_to_history", MagicMock())
+        route = next(r for r in app.routes
+                     if getattr(r, "path", None) == "/execute_command")
+
+        await asyncio.gather(
+            route.endpoint({"prompt": "first question", "project_id": "p"}),
+            route.endpoint({"prompt": "second question", "project_id": "p"}))
+
+        assert [m["content"] for m in stored["session_messages"][1:]] == [
+            "first question", "re: first question",
+            "second question", "re: second question"]
+
+
 class TestAIIntegrationRoutes:
     """Test AI integration endpoints."""
     
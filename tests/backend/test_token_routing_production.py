@@ -12,11 +12,10 @@ Test Categories:
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 from main import app
 from tests.fixtures.mock_viewport_data import get_mock_viewport_context
 from tests.fixtures.mock_openai_responses import (
-    create_mock_openai_response,
     DIRECT_TOKEN_RESPONSES,
     get_mock_context_response
 )
@@ -127,13 +126,11 @@ class TestKeywordRoutingUnitTests:
 class TestOpenAIMockedIntegration:
     """Integration tests with mocked OpenAI responses for deterministic behavior."""
     
-    @patch('openai.chat.completions.create')
+    @patch('app.routes.call_openai_chat', new_callable=AsyncMock)
     def test_non_keyword_query_calls_openai(self, mock_openai):
         """Test that non-keyword queries fall through to OpenAI."""
         # Setup mock
-        mock_openai.return_value = create_mock_openai_response(
-            "[UE_REQUEST] describe_viewport"
-        )
+        mock_openai.return_value = "[UE_REQUEST] describe_viewport"
         
         response = client.post("/execute_command", json={"prompt": "What's happening in the editor?"})
         
@@ -149,13 +146,11 @@ class TestOpenAIMockedIntegration:
             "response": "[UE_REQUEST] describe_viewport"
         }
     
-    @patch('openai.chat.completions.create')
+    @patch('app.routes.call_openai_chat', new_callable=AsyncMock)
     def test_openai_response_starting_with_token_gets_extracted(self, mock_openai):
         """Test that OpenAI responses starting with [UE_REQUEST] get extracted correctly."""
         # Mock AI response that STARTS with token (will be extracted and reformatted)
-        mock_openai.return_value = create_mock_openai_response(
-            "[UE_REQUEST] describe_viewport"
-        )
+        mock_openai.return_value = "[UE_REQUEST] describe_viewport"
         
         # Use non-keyword query to trigger OpenAI
         response = client.post("/execute_command", json={"prompt": "Can you help me understand the editor?"})
@@ -173,7 +168,7 @@ class TestOpenAIMockedIntegration:
 class TestAnswerWithContextDeterministic:
     """Test /answer_with_context with mocked OpenAI for deterministic responses."""
     
-    @patch('openai.chat.completions.create')
+    @patch('app.routes.call_openai_chat', new_callable=AsyncMock)
     def test_viewport_context_processing_exact_response(self, mock_openai):
         """Test viewport context produces deterministic AI response."""
         viewport_context = get_mock_viewport_context()
@@ -184,7 +179,7 @@ class TestAnswerWithContextDeterministic:
             viewport_context,
             "viewport"
         )
-        mock_openai.return_value = create_mock_openai_response(expected_response)
+        mock_openai.return_value = expected_response
         
         response = client.post("/answer_with_context", json={
             "question": "Where is the camera?",
@@ -198,7 +193,7 @@ class TestAnswerWithContextDeterministic:
         assert "response" in data
         assert data["response"] == expected_response
     
-    @patch('openai.chat.completions.create')
+    @patch('app.routes.call_openai_chat', new_callable=AsyncMock)
     def test_project_info_context_with_distinctive_data(self, mock_openai):
         """Test project context with distinctive data produces exact expected response."""
         distinctive_project = {
@@ -212,7 +207,7 @@ class TestAnswerWithContextDeterministic:
             distinctive_project,
             "project_info"
         )
-        mock_openai.return_value = create_mock_openai_response(expected_response)
+        mock_openai.return_value = expected_response
         
         response = client.post("/answer_with_context", json={
             "question": "What project am I working on?",
@@ -232,7 +227,7 @@ class TestAnswerWithContextDeterministic:
 class TestCompleteRoundtripWithMocks:
     """Test complete flow: query → token → context → AI response (all mocked)."""
     
-    @patch('openai.chat.completions.create')
+    @patch('app.routes.call_openai_chat', new_callable=AsyncMock)
     def test_project_info_complete_flow_deterministic(self, mock_openai):
         """Test complete project info flow with deterministic mocked responses."""
         
@@ -258,7 +253,7 @@ class TestCompleteRoundtripWithMocks:
         
         # Step 3: Mock AI response for context processing
         expected_ai_response = get_mock_context_response(query, project_context, "project_info")
-        mock_openai.return_value = create_mock_openai_response(expected_ai_response)
+        mock_openai.return_value = expected_ai_response
         
         # Step 4: UE5 calls /answer_with_context
         ai_response = client.post("/answer_with_context", json={
@@ -322,8 +317,9 @@ class TestStrictJSONContractValidation:
     
     def test_answer_with_context_response_structure(self):
         """Validate /answer_with_context response structure."""
-        with patch('openai.chat.completions.create') as mock_openai:
-            mock_openai.return_value = create_mock_openai_response("Test response")
+        with patch('app.routes.call_openai_chat',
+                   new_callable=AsyncMock) as mock_openai:
+            mock_openai.return_value = "Test response"
             
             response = client.post("/answer_with_context", json={
                 "question": "test",
@@ -12,9 +12,16 @@ Gathers comprehensive project information including:
 Uses UE5.6 Python API (Asset Registry, Plugin Manager, etc.)
 """
 
+import heapq
 import os
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from operator import itemgetter
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from ..core.utils import json_loads
 
 # Type checking guard for Unreal module
 try:
@@ -24,6 +31,94 @@ except ImportError:
     UNREAL_AVAILABLE = False
     print("[ProjectMetadata] Unreal module not available - running in test mode")
 
+# Optional streaming parser for large .uproject files
+try:
+    import ijson  # type: ignore
+    HAS_IJSON = True
+except ImportError:
+    ijson = None  # type: ignore  # Optional dependency
+    HAS_IJSON = False
+
+
+@dataclass(frozen=True)
+class _PathsSnapshot:
+    """unreal.Paths / SystemLibrary values used by the collector."""
+    project_file: str
+    project_dir: str
+    content_dir: str
+    saved_dir: str
+    engine_version: str
+
+
+# Most directory listings kept; well above the folder count of a large
+# project's Content and Source trees
+DIR_LISTING_CACHE_SIZE = 8192
+
+# path -> (mtime_ns, subdirectory paths, file names), least recently used
+# first. A directory's mtime changes whenever an entry is added, removed or
+# renamed directly inside it, so an unchanged mtime means the cached
+# listing is still accurate.
+_dir_listing_cache: "OrderedDict[str, Tuple[int, Tuple[str, ...], Tuple[str, ...]]]" = (
+    OrderedDict())
+
+
+def _list_dir(path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    List a directory as (subdirectory paths, file names).
+    
+    Listings are memoized per directory and reused while its mtime is
+    unchanged, so re-scanning an unchanged tree costs one stat per folder.
+    The cache holds at most DIR_LISTING_CACHE_SIZE directories, and a
+    directory that can no longer be read is dropped from it. Symlinked
+    directories are reported as neither, matching os.walk's default of not
+    following them.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        # Deleted or renamed since it was cached
+        _dir_listing_cache.pop(path, None)
+        raise
+    cached = _dir_listing_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        _dir_listing_cache.move_to_end(path)
+        return cached[1], cached[2]
+    
+    subdirs = []
+    files = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                files.append(entry.name)
+    
+    listing = (tuple(subdirs), tuple(files))
+    _dir_listing_cache[path] = (mtime_ns,) + listing
+    _dir_listing_cache.move_to_end(path)
+    while len(_dir_listing_cache) > DIR_LISTING_CACHE_SIZE:
+        _dir_listing_cache.popitem(last=False)
+    return listing
+
+
+def _iter_file_names(root: str) -> Iterator[str]:
+    """
+    Yield the names of all files below root.
+    
+    Iterative walk over cached os.scandir listings. Like os.walk,
+    symlinked directories are not followed and unreadable directories
+    are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            subdirs, files = _list_dir(stack.pop())
+        except OSError:
+            continue
+        stack.extend(subdirs)
+        yield from files
+
 
 class ProjectMetadataCollector:
     """Collects comprehensive metadata about the UE5 project."""
@@ -35,8 +130,12 @@ class ProjectMetadataCollector:
             cache_ttl_seconds: Cache time-to-live in seconds (default 300 = 5 minutes)
         """
         self.cache: Optional[Dict[str, Any]] = None
-        self.cache_timestamp: Optional[datetime] = None
+        # time.monotonic() of the last collection (immune to clock changes)
+        self.cache_timestamp: Optional[float] = None
         self.cache_ttl_seconds = cache_ttl_seconds
+        # ((path, mtime), sections) of the last parsed .uproject
+        self._uproject_cache: Optional[Tuple[Tuple[str, float], Dict[str, Any]]] = None
+        self._paths: Optional[_PathsSnapshot] = None
     
     def collect_all_metadata(self, use_cache: bool = True) -> Dict[str, Any]:
         """
@@ -52,12 +151,13 @@ class ProjectMetadataCollector:
         if use_cache and self._is_cache_valid():
             return self.cache  # type: ignore
         
+        assets, blueprints = self._collect_assets_and_blueprints()
         metadata = {
             "project": self._collect_project_info(),
             "modules": self._collect_module_info(),
             "plugins": self._collect_plugin_info(),
-            "assets": self._collect_asset_info(),
-            "blueprints": self._collect_blueprint_info(),
+            "assets": assets,
+            "blueprints": blueprints,
             "source_code": self._collect_source_code_info(),
             "content_structure": self._collect_content_structure(),
             "timestamp": datetime.now().isoformat()
@@ -65,17 +165,72 @@ class ProjectMetadataCollector:
         
         # Update cache
         self.cache = metadata
-        self.cache_timestamp = datetime.now()
+        self.cache_timestamp = time.monotonic()
         
         return metadata
     
     def _is_cache_valid(self) -> bool:
         """Check if cache is valid and fresh."""
-        if not self.cache or not self.cache_timestamp:
+        if not self.cache or self.cache_timestamp is None:
             return False
         
-        elapsed = (datetime.now() - self.cache_timestamp).total_seconds()
-        return elapsed < self.cache_ttl_seconds
+        return time.monotonic() - self.cache_timestamp < self.cache_ttl_seconds
+    
+    def _get_paths(self) -> _PathsSnapshot:
+        """
+        Get project paths and engine version, querying Unreal only once.
+        
+        These cannot change while the editor is running, so one snapshot
+        replaces repeated calls across the Python/engine boundary.
+        """
+        if self._paths is None:
+            self._paths = _PathsSnapshot(
+                project_file=unreal.Paths.get_project_file_path(),  # type: ignore
+                project_dir=unreal.Paths.project_dir(),  # type: ignore
+                content_dir=unreal.Paths.project_content_dir(),  # type: ignore
+                saved_dir=unreal.Paths.project_saved_dir(),  # type: ignore
+                engine_version=unreal.SystemLibrary.get_engine_version()  # type: ignore
+            )
+        return self._paths
+    
+    def _read_uproject_sections(
+        self,
+        path: str,
+        keys: Sequence[str] = ("Modules", "Plugins")
+    ) -> Dict[str, Any]:
+        """
+        Read selected top-level sections of a .uproject file.
+        
+        The file is parsed once per modification, so module and plugin
+        collection share a single read. With ijson installed only the
+        top-level pairs up to the last requested key are materialized.
+        
+        Args:
+            path: Path to the .uproject file.
+            keys: Top-level keys to extract.
+            
+        Returns:
+            Dictionary of the requested sections that exist in the file.
+        """
+        cache_key = (path, os.path.getmtime(path))
+        if self._uproject_cache and self._uproject_cache[0] == cache_key:
+            return self._uproject_cache[1]
+        
+        wanted = set(keys)
+        sections: Dict[str, Any] = {}
+        with open(path, 'rb') as f:
+            if HAS_IJSON and ijson is not None:
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    if key in wanted:
+                        sections[key] = value
+                        if len(sections) == len(wanted):
+                            break
+            else:
+                project_data = json_loads(f.read())
+                sections = {k: project_data[k] for k in keys if k in project_data}
+        
+        self._uproject_cache = (cache_key, sections)
+        return sections
     
     def _collect_project_info(self) -> Dict[str, Any]:
         """Collect basic project information."""
@@ -87,12 +242,13 @@ class ProjectMetadataCollector:
             }
         
         try:
+            paths = self._get_paths()
             return {
-                "name": unreal.Paths.get_project_file_path().split('/')[-1].replace('.uproject', ''),  # type: ignore
-                "project_dir": unreal.Paths.project_dir(),  # type: ignore
-                "content_dir": unreal.Paths.project_content_dir(),  # type: ignore
-                "saved_dir": unreal.Paths.project_saved_dir(),  # type: ignore
-                "engine_version": unreal.SystemLibrary.get_engine_version()  # type: ignore
+                "name": paths.project_file.split('/')[-1].replace('.uproject', ''),
+                "project_dir": paths.project_dir,
+                "content_dir": paths.content_dir,
+                "saved_dir": paths.saved_dir,
+                "engine_version": paths.engine_version
             }
         except Exception as e:
             return {"error": str(e)}
@@ -107,19 +263,16 @@ class ProjectMetadataCollector:
         
         try:
             # Read .uproject file to get module information
-            project_file = unreal.Paths.get_project_file_path()  # type: ignore
+            project_file = self._get_paths().project_file
             if os.path.exists(project_file):
-                with open(project_file, 'r') as f:
-                    import json
-                    project_data = json.load(f)
-                    modules = project_data.get("Modules", [])
-                    return {
-                        "total_modules": len(modules),
-                        "modules": [
-                            {"name": m.get("Name"), "type": m.get("Type")}
-                            for m in modules
-                        ]
-                    }
+                modules = self._read_uproject_sections(project_file).get("Modules", [])
+                return {
+                    "total_modules": len(modules),
+                    "modules": [
+                        {"name": m.get("Name"), "type": m.get("Type")}
+                        for m in modules
+                    ]
+                }
             return {
                 "total_modules": 0,
                 "modules": []
@@ -137,19 +290,16 @@ class ProjectMetadataCollector:
         
         try:
             # Read .uproject file to get plugin information
-            project_file = unreal.Paths.get_project_file_path()  # type: ignore
+            project_file = self._get_paths().project_file
             if os.path.exists(project_file):
-                with open(project_file, 'r') as f:
-                    import json
-                    project_data = json.load(f)
-                    plugins = project_data.get("Plugins", [])
-                    return {
-                        "total_plugins": len(plugins),
-                        "enabled_plugins": [
-                            {"name": p.get("Name"), "enabled": p.get("Enabled", True)} 
-                            for p in plugins if p.get("Enabled", True)
-                        ]
-                    }
+                plugins = self._read_uproject_sections(project_file).get("Plugins", [])
+                return {
+                    "total_plugins": len(plugins),
+                    "enabled_plugins": [
+                        {"name": p.get("Name"), "enabled": p.get("Enabled", True)} 
+                        for p in plugins if p.get("Enabled", True)
+                    ]
+                }
             return {
                 "total_plugins": 0,
                 "enabled_plugins": []
@@ -157,13 +307,27 @@ class ProjectMetadataCollector:
         except Exception as e:
             return {"error": str(e)}
     
-    def _collect_asset_info(self) -> Dict[str, Any]:
-        """Collect asset statistics using Asset Registry."""
+    def _collect_assets_and_blueprints(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Collect asset and Blueprint statistics using Asset Registry.
+        
+        Blueprints are a subset of the /Game assets, so both are gathered
+        from a single registry query.
+        
+        Returns:
+            Tuple of (asset info, blueprint info) dictionaries.
+        """
         if not UNREAL_AVAILABLE:
-            return {
-                "total_assets": 0,
-                "by_type": {}
-            }
+            return (
+                {
+                    "total_assets": 0,
+                    "by_type": {}
+                },
+                {
+                    "total_blueprints": 0,
+                    "blueprints": []
+                }
+            )
         
         try:
             # Get asset registry
@@ -177,79 +341,49 @@ class ProjectMetadataCollector:
             
             all_assets = asset_registry.get_assets(ar_filter)
             
-            # Count by type
-            type_counts: Dict[str, int] = {}
+            # Count by type and categorize blueprints by path in one pass
+            type_counts: Counter = Counter()
+            by_folder: Counter = Counter()
+            blueprint_list = []
+            total_blueprints = 0
+            
             for asset_data in all_assets:
                 asset_class = str(asset_data.asset_class_path.asset_name)
-                type_counts[asset_class] = type_counts.get(asset_class, 0) + 1
-            
-            # Sort by count descending
-            sorted_types = sorted(type_counts.items(), key=lambda x: x[1], reverse=True)
+                type_counts[asset_class] += 1
+                if asset_class != 'Blueprint':
+                    continue
+                
+                total_blueprints += 1
+                package_path = str(asset_data.package_name)
+                by_folder[package_path.rpartition('/')[0]] += 1
+                
+                if len(blueprint_list) < 50:  # First 50 blueprints
+                    blueprint_list.append({
+                        "name": str(asset_data.asset_name),
+                        "path": package_path,
+                        "class": asset_class
+                    })
             
-            return {
+            asset_info = {
                 "total_assets": len(all_assets),
-                "by_type": dict(sorted_types[:20]),  # Top 20 types
+                "by_type": dict(type_counts.most_common(20)),  # Top 20 types
                 "unique_types": len(type_counts)
             }
-        except Exception as e:
-            return {"error": str(e)}
-    
-    def _collect_blueprint_info(self) -> Dict[str, Any]:
-        """Collect Blueprint-specific information."""
-        if not UNREAL_AVAILABLE:
-            return {
-                "total_blueprints": 0,
-                "blueprints": []
-            }
-        
-        try:
-            # Get asset registry
-            asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()  # type: ignore
-            
-            # Filter for blueprints only
-            ar_filter = unreal.ARFilter(  # type: ignore
-                class_names=['Blueprint'],
-                package_paths=['/Game'],
-                recursive_paths=True
-            )
-            
-            blueprints = asset_registry.get_assets(ar_filter)
-            
-            # Categorize blueprints by path
-            by_folder: Dict[str, int] = {}
-            blueprint_list = []
-            
-            for bp_data in blueprints[:100]:  # Limit to 100 for performance
-                package_path = str(bp_data.package_name)
-                folder = '/'.join(package_path.split('/')[:-1])
-                by_folder[folder] = by_folder.get(folder, 0) + 1
-                
-                blueprint_list.append({
-                    "name": str(bp_data.asset_name),
-                    "path": package_path,
-                    "class": str(bp_data.asset_class_path.asset_name)
-                })
-            
-            return {
-                "total_blueprints": len(blueprints),
-                "by_folder": dict(
-                    sorted(
-                        by_folder.items(),
-                        key=lambda x: x[1],
-                        reverse=True
-                    )[:10]
-                ),
-                "blueprints": blueprint_list[:50]  # First 50 blueprints
+            blueprint_info = {
+                "total_blueprints": total_blueprints,
+                "by_folder": dict(by_folder.most_common(10)),
+                "blueprints": blueprint_list
             }
+            return asset_info, blueprint_info
         except Exception as e:
-            return {"error": str(e)}
+            return {"error": str(e)}, {"error": str(e)}
     
     def _collect_source_code_info(self) -> Dict[str, Any]:
         """Collect source code file statistics."""
         if not UNREAL_AVAILABLE:
             source_dir = os.path.join(os.getcwd(), "Source")
         else:
-            project_dir = unreal.Paths.project_dir()  # type: ignore
+            project_dir = self._get_paths().project_dir
             source_dir = os.path.join(project_dir, "Source")
         
         if not os.path.exists(source_dir):
@@ -264,14 +398,15 @@ class ProjectMetadataCollector:
             h_files = 0
             cs_files = 0
             
-            for _, _, files in os.walk(source_dir):
-                for file in files:
-                    if file.endswith('.cpp'):
-                        cpp_files += 1
-                    elif file.endswith('.h'):
-                        h_files += 1
-                    elif file.endswith('.cs'):
-                        cs_files += 1
+            for name in _iter_file_names(source_dir):
+                if not name.endswith(('.cpp', '.h', '.cs')):
+                    continue
+                if name.endswith('.cpp'):
+                    cpp_files += 1
+                elif name.endswith('.h'):
+                    h_files += 1
+                else:
+                    cs_files += 1
             
             return {
                 "has_source_code": True,
@@ -289,7 +424,7 @@ class ProjectMetadataCollector:
         if not UNREAL_AVAILABLE:
             content_dir = os.path.join(os.getcwd(), "Content")
         else:
-            content_dir = unreal.Paths.project_content_dir()  # type: ignore
+            content_dir = self._get_paths().content_dir
         
         if not os.path.exists(content_dir):
             return {
@@ -300,22 +435,18 @@ class ProjectMetadataCollector:
         try:
             # Get top-level content folders
             folders = []
-            for item in os.listdir(content_dir):
-                item_path = os.path.join(content_dir, item)
-                if os.path.isdir(item_path):
-                    # Count files in folder
-                    file_count = sum(len(files) for _, _, files in os.walk(item_path))
-                    folders.append({
-                        "name": item,
-                        "path": item_path,
-                        "file_count": file_count
-                    })
-            
-            # Sort by file count
-            folders.sort(key=lambda x: x['file_count'], reverse=True)
+            for item_path in _list_dir(content_dir)[0]:
+                # Count files in folder
+                file_count = sum(1 for _ in _iter_file_names(item_path))
+                folders.append({
+                    "name": os.path.basename(item_path),
+                    "path": item_path,
+                    "file_count": file_count
+                })
             
             return {
-                "content_folders": folders[:20],  # Top 20 folders
+                # Top 20 folders by file count
+                "content_folders": heapq.nlargest(20, folders, key=itemgetter('file_count')),
                 "total_folders": len(folders)
             }
         except Exception as e:
@@ -5,7 +5,7 @@ Logging, file operations, and common helpers.
 import datetime
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 
 try:
     import unreal  # type: ignore
@@ -14,6 +14,13 @@ except ImportError:
     HAS_UNREAL = False
     unreal = None  # type: ignore  # Only available in UE environment
 
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore  # Optional dependency
+    HAS_ORJSON = False
+
 
 class Logger:
     """Unified logging system for the AI Assistant."""
@@ -114,3 +121,17 @@ def log_conversation(role: str, text: str) -> None:
     append_file(
         log_path, json.dumps(entry, ensure_ascii=False) + "\n"
     )
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON (orjson when installed)."""
+    if HAS_ORJSON and orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str (orjson when installed)."""
+    if HAS_ORJSON and orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,149 +2,444 @@
 Local UE5 Web Server - Enables browser → UE5 communication
 Turns UE5 into a controllable server that responds to dashboard commands.
 
+Uses aiohttp when it is installed in UE5's Python environment so that
+concurrent dashboard requests overlap instead of queueing behind a slow
+command. Falls back to the stdlib ThreadingHTTPServer otherwise.
+
+Commands are not run on the HTTP thread: they are pushed onto a bounded
+queue drained by a single worker thread, and the handler waits on a
+Future for the result. A full queue is answered with 503.
+
 Usage in UE5:
     import AIAssistant.local_server
     AIAssistant.local_server.start_server()
 """
-import json
+import asyncio
+import queue
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import unreal
 
+from ..core.utils import json_dumps, json_loads
+
+try:
+    from aiohttp import web  # type: ignore
+    HAS_AIOHTTP = True
+except ImportError:
+    web = None  # type: ignore  # Optional dependency
+    HAS_AIOHTTP = False
+
+
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, GET, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+}
+
+# Raw header lines for the http.server fast paths
+_CORS_HEADER_BYTES = ''.join(
+    f'{name}: {value}\r\n' for name, value in _CORS_HEADERS.items()
+).encode('latin-1')
+_JSON_HEADER_BYTES = b'Content-Type: application/json\r\n' + _CORS_HEADER_BYTES
+
+# Status lines for every code UE5CommandHandler answers with. HTTP/1.0
+# matches BaseHTTPRequestHandler.protocol_version, which closes the
+# connection after every response.
+_STATUS_LINES = {
+    code: b'HTTP/1.0 %d %s\r\n' % (
+        code, BaseHTTPRequestHandler.responses[code][0].encode('latin-1'))
+    for code in (200, 404, 500, 503, 504)
+}
+_NOT_FOUND_RESPONSE = _STATUS_LINES[404] + b'Content-Length: 0\r\n\r\n'
+
+# Request queue settings
+REQUEST_QUEUE_SIZE = 64
+REQUEST_TIMEOUT = 30  # seconds a handler waits for its command result
+
+
+def _health_payload():
+    """Build the /health response body."""
+    return {
+        'status': 'running',
+        'project': unreal.SystemLibrary.get_game_name(),
+        'engine_version': unreal.SystemLibrary.get_engine_version()
+    }
+
+
+def _build_response(status, body=b''):
+    """
+    Assemble a complete HTTP response for UE5CommandHandler.
+
+    Args:
+        status: HTTP status code (a key of _STATUS_LINES)
+        body: Encoded JSON body (empty for preflight responses)
+    """
+    headers = _JSON_HEADER_BYTES if body else _CORS_HEADER_BYTES
+    return (_STATUS_LINES[status] + headers
+            + b'Content-Length: %d\r\n\r\n' % len(body) + body)
+
+
+_OPTIONS_RESPONSE = _build_response(200)
+
+# Pre-encoded /health response, filled in by start_server. The project name
+# and engine version cannot change while the editor is running.
+_health_body = b''
+_health_response = b''
+
+
+def _encode_health():
+    """Encode the /health body and full response once."""
+    global _health_body, _health_response
+
+    _health_body = json_dumps(_health_payload())
+    _health_response = _build_response(200, _health_body)
+
+
+# Command functions import their modules per call: /update clears
+# AIAssistant.* from sys.modules, and a module-level reference would keep
+# running the superseded code
+def _execute_command(data):
+    """Execute an AI command typed into the dashboard."""
+    from ..core.main import send_command
+    user_input = data.get('command', '')
+    response = send_command(user_input)
+    return {
+        'success': True,
+        'response': response
+    }
+
+
+def _register_project(data):
+    """Register the current project with the backend."""
+    from ..network.api_client import get_client
+    from ..system.project_registration import auto_register_project
+    return auto_register_project(get_client())
+
+
+def _update_client(data):
+    """Run the client auto-updater."""
+    from . import auto_update
+    success = auto_update.check_and_update()
+    return {
+        'success': success
+    }
+
+
+# POST path (without slashes) -> blocking command function
+_COMMANDS = {
+    'execute': _execute_command,
+    'register': _register_project,
+    'update': _update_client,
+}
+
+
+# ============================================================================
+# Command queue
+# ============================================================================
+
+_request_q = None
+_worker = None
+
+
+def _worker_loop(request_q):
+    """
+    Drain the request queue until a None sentinel arrives.
+
+    There is exactly one worker, so commands run one at a time: two
+    updates never rewrite the client files together, and send_command()
+    never overlaps a registration or update.
+    """
+    while True:
+        item = request_q.get()
+        if item is None:
+            break
+
+        func, data, future = item
+        if not future.set_running_or_notify_cancel():
+            continue  # Caller gave up before we got to it
+        try:
+            future.set_result(func(data))
+        except Exception as e:
+            future.set_exception(e)
+
+
+def _start_workers():
+    """Create the request queue and start the worker thread."""
+    global _request_q, _worker
+
+    _request_q = queue.Queue(maxsize=REQUEST_QUEUE_SIZE)
+    _worker = threading.Thread(target=_worker_loop,
+                               args=(_request_q,),
+                               name="UE5LocalServerWorker",
+                               daemon=True)
+    _worker.start()
+
+
+def _cancel_pending(request_q):
+    """Remove every queued command and cancel its Future."""
+    while True:
+        try:
+            item = request_q.get_nowait()
+        except queue.Empty:
+            return
+        if item is not None:
+            item[2].cancel()
+
+
+def _stop_workers():
+    """
+    Signal the worker to exit after its current command.
+
+    Queued commands are cancelled rather than run, and the sentinel is
+    never put with a blocking call, so stop_server() does not stall the
+    editor behind a full queue.
+    """
+    global _request_q, _worker
+
+    request_q = _request_q
+    if request_q is None:
+        return
+    _request_q = None
+    while True:
+        _cancel_pending(request_q)
+        try:
+            request_q.put_nowait(None)
+            break
+        except queue.Full:
+            continue  # A late submit refilled the queue
+    _worker = None
+
+
+def _submit(func, data):
+    """
+    Queue a command for the worker.
+
+    Returns:
+        Future resolved with the command's result, or cancelled if the
+        server stops before the command runs.
+
+    Raises:
+        queue.Full: If the queue is at capacity or the server is stopping
+            (caller should answer 503).
+    """
+    request_q = _request_q
+    if request_q is None:
+        raise queue.Full
+    future = Future()
+    request_q.put_nowait((func, data, future))
+    return future
+
 
 class UE5CommandHandler(BaseHTTPRequestHandler):
     """Handles HTTP requests from the browser dashboard."""
-    
+
+    # POST path -> command function (shared with the aiohttp backend)
+    _DISPATCH = _COMMANDS
+
     def do_GET(self):
         """Handle GET requests."""
         if self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            response = {
-                'status': 'running',
-                'project': unreal.SystemLibrary.get_game_name(),
-                'engine_version': unreal.SystemLibrary.get_engine_version()
-            }
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(_health_response)
         else:
-            self.send_response(404)
-            self.end_headers()
-    
+            self.wfile.write(_NOT_FOUND_RESPONSE)
+
     def do_POST(self):
         """Handle POST requests from dashboard."""
         content_length = int(self.headers.get('Content-Length', 0))
-        body = self.rfile.read(content_length).decode()
-        
+        body = self.rfile.read(content_length)
+
         try:
-            data = json.loads(body) if body else {}
-            command = self.path.strip('/')
-            
-            # CORS headers
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-            
-            if command == 'execute':
-                # Execute AI command
-                user_input = data.get('command', '')
-                from ..core.main import send_command
-                response = send_command(user_input)
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': True,
-                    'response': response
-                }).encode())
-                
-            elif command == 'register':
-                # Register project
-                from ..network.api_client import get_client
-                from ..system.project_registration import auto_register_project
-                
-                result = auto_register_project(get_client())
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps(result).encode())
-                
-            elif command == 'update':
-                # Auto-update client
-                from . import auto_update
-                success = auto_update.check_and_update()
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': success
-                }).encode())
-            
-            else:
-                self.send_response(404)
-                self.end_headers()
-                
+            data = json_loads(body) if body else {}
+            func = self._DISPATCH.get(self.path.strip('/'))
+            if func is None:
+                self._send_error(404, f"Unknown command: {self.path}")
+                return
+
+            try:
+                result = _submit(func, data).result(timeout=REQUEST_TIMEOUT)
+            except queue.Full:
+                self._send_error(503, 'Server busy, try again shortly')
+                return
+            except CancelledError:
+                self._send_error(503, 'Server stopping')
+                return
+            except FutureTimeoutError:
+                self._send_error(504, f"Command timed out after {REQUEST_TIMEOUT}s")
+                return
+
+            self._write_json(200, result)
+
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({
-                'error': str(e)
-            }).encode())
-    
+            self._send_error(500, str(e))
+
     def do_OPTIONS(self):
         """Handle CORS preflight."""
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'POST, GET, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
-    
+        self.wfile.write(_OPTIONS_RESPONSE)
+
+    def _write_json(self, status, obj):
+        """Write status line, headers and JSON body with a single write."""
+        self.wfile.write(_build_response(status, json_dumps(obj)))
+
+    def _send_error(self, status, message):
+        """Send a JSON error body."""
+        self._write_json(status, {
+            'error': message
+        })
+
     def log_message(self, format, *args):
         """Suppress default logging."""
         pass
 
 
+# ============================================================================
+# aiohttp backend
+# ============================================================================
+
+def _aio_json(obj, status=200):
+    """Build a JSON aiohttp response with CORS headers."""
+    return web.Response(body=json_dumps(obj),
+                        status=status,
+                        content_type='application/json',
+                        headers=_CORS_HEADERS)
+
+
+def _make_command_route(func):
+    """Wrap a blocking command function as an aiohttp request handler."""
+    async def handle(request):
+        future = None
+        try:
+            body = await request.read()
+            data = json_loads(body) if body else {}
+            future = _submit(func, data)
+            result = await asyncio.wait_for(asyncio.wrap_future(future),
+                                            REQUEST_TIMEOUT)
+            return _aio_json(result)
+        except queue.Full:
+            return _aio_json({'error': 'Server busy, try again shortly'}, 503)
+        except asyncio.CancelledError:
+            if future is None or not future.cancelled():
+                raise  # The request itself was cancelled
+            return _aio_json({'error': 'Server stopping'}, 503)
+        except asyncio.TimeoutError:
+            return _aio_json(
+                {'error': f"Command timed out after {REQUEST_TIMEOUT}s"}, 504)
+        except Exception as e:
+            return _aio_json({'error': str(e)}, 500)
+    return handle
+
+
+async def _aio_health(request):
+    """Handle GET /health."""
+    return web.Response(body=_health_body,
+                        content_type='application/json',
+                        headers=_CORS_HEADERS)
+
+
+async def _aio_fallback(request):
+    """Answer CORS preflight for any path; 404 everything else."""
+    if request.method == 'OPTIONS':
+        return web.Response(headers=_CORS_HEADERS)
+    return web.Response(status=404)
+
+
+def _build_app():
+    """Create the aiohttp application with all dashboard routes."""
+    app = web.Application()
+    app.router.add_get('/health', _aio_health)
+    for command, func in _COMMANDS.items():
+        app.router.add_post(f'/{command}', _make_command_route(func))
+    app.router.add_route('*', '/{tail:.*}', _aio_fallback)
+    return app
+
+
+def _start_aiohttp(port):
+    """Bind the aiohttp server and run its event loop on a daemon thread."""
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(_build_app(), access_log=None)
+    try:
+        # Bind synchronously so start_server can report port conflicts
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, 'localhost', port).start())
+    except Exception:
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
+        raise
+
+    def run():
+        asyncio.set_event_loop(loop)
+        unreal.log(f"🌐 UE5 Local Server (aiohttp) started on http://localhost:{port}")
+        unreal.log("📡 Browser dashboard can now send commands to UE5!")
+        unreal.log(f"💡 Configure dashboard to use: http://localhost:{port}")
+        loop.run_forever()
+        loop.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return runner, loop, thread
+
+
 _server = None
 _server_thread = None
+_runner = None
+_loop = None
 
 def start_server(port=8765):
     """Start local UE5 web server for browser communication."""
-    global _server, _server_thread
-    
-    if _server:
+    global _server, _server_thread, _runner, _loop
+
+    if _server or _runner:
         unreal.log("⚠️  Server already running")
         return
-    
+
     try:
-        _server = HTTPServer(('localhost', port), UE5CommandHandler)
-        
-        def run():
-            unreal.log(f"🌐 UE5 Local Server started on http://localhost:{port}")
-            unreal.log("📡 Browser dashboard can now send commands to UE5!")
-            unreal.log("💡 Configure dashboard to use: http://localhost:8765")
-            _server.serve_forever()
-        
-        _server_thread = threading.Thread(target=run, daemon=True)
-        _server_thread.start()
-        
+        _encode_health()
+        _start_workers()
+        if HAS_AIOHTTP:
+            _runner, _loop, _server_thread = _start_aiohttp(port)
+        else:
+            # daemon_threads is set on ThreadingHTTPServer, so in-flight
+            # requests never block editor shutdown
+            _server = ThreadingHTTPServer(('localhost', port), UE5CommandHandler)
+
+            def run():
+                unreal.log(f"🌐 UE5 Local Server started on http://localhost:{port}")
+                unreal.log("📡 Browser dashboard can now send commands to UE5!")
+                unreal.log("💡 Configure dashboard to use: http://localhost:8765")
+                _server.serve_forever()
+
+            _server_thread = threading.Thread(target=run, daemon=True)
+            _server_thread.start()
+
         return True
     except Exception as e:
+        _stop_workers()
         unreal.log_error(f"❌ Failed to start server: {e}")
         return False
 
 
 def stop_server():
     """Stop the local server."""
-    global _server, _server_thread
-    
+    global _server, _server_thread, _runner, _loop
+
+    if _runner:
+        try:
+            asyncio.run_coroutine_threadsafe(_runner.cleanup(),
+                                             _loop).result(timeout=5)
+        finally:
+            _loop.call_soon_threadsafe(_loop.stop)
+            _stop_workers()
+            _runner = None
+            _loop = None
+            _server_thread = None
+        unreal.log("🛑 UE5 Local Server stopped")
+        return True
+
     if _server:
         _server.shutdown()
+        _stop_workers()
         _server = None
         _server_thread = None
         unreal.log("🛑 UE5 Local Server stopped")